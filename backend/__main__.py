@@ -6,6 +6,8 @@ from dotenv import load_dotenv
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from src.api import router as api_router
+from src.api.v1.docker import docker_service
+from src.api.v1.speedtest import speedtest_service
 from src.db import DatabaseInitializer, get_db
 from src.utils.logger import get_logger
 
@@ -24,11 +26,14 @@ async def lifespan(app: FastAPI):
     db = get_db()
     await DatabaseInitializer().init_db(db)
     await db.connect()
+    docker_service.start_event_watcher()
     logger.info("Application setup completed successfully")
     # ================== END SETUP ==================
     yield
     # ================== SHUTDOWN ==================
     logger.info("Starting application shutdown...")
+    await docker_service.stop_event_watcher()
+    speedtest_service.close()
     await db.disconnect()  # type: ignore
     logger.info("Application shutdown completed")
     # ================== END SHUTDOWN ==================
@@ -2,6 +2,7 @@ from fastapi import APIRouter, HTTPException
 
 from ...schemas.v1.docker import (
     ContainerHealthResponse,
+    ContainerInfoListResponse,
     ContainerInfoResponse,
     ContainerListResponse,
     ContainerLogsResponse,
@@ -46,6 +47,17 @@ async def list_containers(all_containers: bool = False):
     return result
 
 
+@router.get("/list/detailed", response_model=ContainerInfoListResponse)
+async def list_containers_detailed(all_containers: bool = True):
+    """Get detailed information about all Docker containers"""
+    result = await docker_service.list_containers_detailed(
+        all_containers=all_containers
+    )
+    if not result.success:
+        raise HTTPException(status_code=400, detail=result.error)
+    return result
+
+
 @router.post("/start", response_model=ContainerOperationResponse)
 async def start_container(request: ContainerNameRequest):
     """Start a Docker container"""
@@ -102,23 +114,30 @@ async def remove_container(container_name: str, force: bool = False):
 
 @router.post("/batch/stop", response_model=list[ContainerOperationResponse])
 async def batch_stop_containers(container_names: list[str]):
-    """Stop multiple Docker containers concurrently"""
+    """Stop multiple Docker containers with a single docker call"""
     result = await docker_service.batch_container_operations(container_names, "stop")
     return result
 
 
 @router.post("/batch/start", response_model=list[ContainerOperationResponse])
 async def batch_start_containers(container_names: list[str]):
-    """Start multiple Docker containers concurrently"""
+    """Start multiple Docker containers with a single docker call"""
     result = await docker_service.batch_container_operations(container_names, "start")
     return result
 
 
 @router.post("/batch/restart", response_model=list[ContainerOperationResponse])
 async def batch_restart_containers(container_names: list[str]):
-    """Restart multiple Docker containers concurrently"""
+    """Restart multiple Docker containers with a single docker call"""
     result = await docker_service.batch_container_operations(container_names, "restart")
     return result
 
 
+@router.post("/batch/info", response_model=list[ContainerInfoResponse])
+async def batch_container_info(container_names: list[str]):
+    """Get information about multiple Docker containers with a single docker call"""
+    result = await docker_service.batch_container_info(container_names)
+    return result
+
+
 __all__ = ["router"]
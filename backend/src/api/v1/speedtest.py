@@ -1,3 +1,5 @@
+from typing import Optional
+
 from fastapi import APIRouter, HTTPException
 
 from ...schemas.v1.speedtest import (
@@ -38,6 +40,12 @@ async def stop_continuous_testing():
     return response
 
 
+@router.put("/server", response_model=SpeedTestConfigResponse)
+async def select_server(server_id: Optional[int] = None):
+    """Pin the speedtest server, or clear the pin to select the best one."""
+    return await speedtest_service.select_server(server_id)
+
+
 @router.get("/config", response_model=SpeedTestConfigResponse)
 async def get_config():
     """Get current speed test configuration."""
@@ -69,9 +77,9 @@ async def get_status():
             else False
         ),
         "interval_seconds": (
-            config_response.config.get("interval_seconds", 1)
+            config_response.config.get("interval_seconds", 300)
             if config_response.config
-            else 1
+            else 300
         ),
         "has_result": result_response.success,
         "last_test_time": (
@@ -1,9 +1,13 @@
+import functools
+
 from danielutils.abstractions.db import Database  # type: ignore
 
 from .database_factory import DatabaseFactory
 
 
+@functools.lru_cache(maxsize=None)
 def get_db() -> Database:
+    # One shared instance, so every service reuses the connection opened at startup
     return DatabaseFactory.get_database_from_settings()
 
 
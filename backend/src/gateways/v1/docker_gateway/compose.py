@@ -5,6 +5,7 @@ Docker Compose gateway for project operations.
 import json
 import logging
 import os
+import shlex
 from typing import List, Optional
 
 from ....utils.command import AsyncCommand
@@ -49,8 +50,7 @@ class DockerComposeGateway:
         if build:
             cmd_parts.append("--build")
 
-        command = " ".join(cmd_parts)
-        async_cmd = AsyncCommand.cmd(command)
+        async_cmd = AsyncCommand(cmd_parts)
         result = await async_cmd.execute()
 
         return DockerCommandResult(
@@ -82,8 +82,7 @@ class DockerComposeGateway:
         if remove_volumes:
             cmd_parts.append("-v")
 
-        command = " ".join(cmd_parts)
-        async_cmd = AsyncCommand.cmd(command)
+        async_cmd = AsyncCommand(cmd_parts)
         result = await async_cmd.execute()
 
         return DockerCommandResult(
@@ -109,8 +108,7 @@ class DockerComposeGateway:
 
         cmd_parts.append("restart")
 
-        command = " ".join(cmd_parts)
-        async_cmd = AsyncCommand.cmd(command)
+        async_cmd = AsyncCommand(cmd_parts)
         result = await async_cmd.execute()
 
         return DockerCommandResult(
@@ -132,8 +130,7 @@ class DockerComposeGateway:
 
         cmd_parts.append("stop")
 
-        command = " ".join(cmd_parts)
-        async_cmd = AsyncCommand.cmd(command)
+        async_cmd = AsyncCommand(cmd_parts)
         result = await async_cmd.execute()
 
         return DockerCommandResult(
@@ -155,8 +152,7 @@ class DockerComposeGateway:
 
         cmd_parts.append("start")
 
-        command = " ".join(cmd_parts)
-        async_cmd = AsyncCommand.cmd(command)
+        async_cmd = AsyncCommand(cmd_parts)
         result = await async_cmd.execute()
 
         return DockerCommandResult(
@@ -178,8 +174,7 @@ class DockerComposeGateway:
 
         cmd_parts.append("pull")
 
-        command = " ".join(cmd_parts)
-        async_cmd = AsyncCommand.cmd(command)
+        async_cmd = AsyncCommand(cmd_parts)
         result = await async_cmd.execute()
 
         return DockerCommandResult(
@@ -201,8 +196,7 @@ class DockerComposeGateway:
 
         cmd_parts.append("build")
 
-        command = " ".join(cmd_parts)
-        async_cmd = AsyncCommand.cmd(command)
+        async_cmd = AsyncCommand(cmd_parts)
         result = await async_cmd.execute()
 
         return DockerCommandResult(
@@ -217,8 +211,7 @@ class DockerComposeGateway:
         cls.logger.info("Listing all compose projects")
 
         # Get all compose projects using docker compose ls
-        command = "docker compose ls --format json"
-        async_cmd = AsyncCommand.cmd(command)
+        async_cmd = AsyncCommand(["docker", "compose", "ls", "--format", "json"])
         result = await async_cmd.execute()
 
         if not result.success:
@@ -261,10 +254,9 @@ class DockerComposeGateway:
         if self.project_dir:
             cmd_parts.extend(["--project-directory", self.project_dir])
 
-        cmd_parts.extend(["exec", service, command])
+        cmd_parts.extend(["exec", service, *shlex.split(command)])
 
-        full_command = " ".join(cmd_parts)
-        async_cmd = AsyncCommand.cmd(full_command)
+        async_cmd = AsyncCommand(cmd_parts)
         result = await async_cmd.execute()
 
         return DockerCommandResult(
@@ -292,8 +284,7 @@ class DockerComposeGateway:
         if service:
             cmd_parts.append(service)
 
-        command = " ".join(cmd_parts)
-        async_cmd = AsyncCommand.cmd(command)
+        async_cmd = AsyncCommand(cmd_parts)
         result = await async_cmd.execute()
 
         return DockerCommandResult(
@@ -317,8 +308,7 @@ class DockerComposeGateway:
 
         cmd_parts.extend(["ps", "--format", "json"])
 
-        command = " ".join(cmd_parts)
-        async_cmd = AsyncCommand.cmd(command)
+        async_cmd = AsyncCommand(cmd_parts)
         result = await async_cmd.execute()
 
         if not result.success:
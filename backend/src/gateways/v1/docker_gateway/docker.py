@@ -4,6 +4,7 @@ Docker gateway for container operations.
 
 import json
 import logging
+import shlex
 from typing import List, Optional
 
 from ....utils.command import AsyncCommand
@@ -31,8 +32,7 @@ class DockerGateway:
 
         cls.logger.info("Starting container: %s", container_name)
 
-        command = f"docker start {container_name}"
-        async_cmd = AsyncCommand.cmd(command)
+        async_cmd = AsyncCommand(["docker", "start", container_name])
         result = await async_cmd.execute()
 
         return DockerCommandResult(
@@ -44,8 +44,7 @@ class DockerGateway:
         """Stop a Docker container."""
         cls.logger.info("Stopping container: %s", container_name)
 
-        command = f"docker stop {container_name}"
-        async_cmd = AsyncCommand.cmd(command)
+        async_cmd = AsyncCommand(["docker", "stop", container_name])
         result = await async_cmd.execute()
 
         return DockerCommandResult(
@@ -58,8 +57,7 @@ class DockerGateway:
 
         cls.logger.info("Restarting container: %s", container_name)
 
-        command = f"docker restart {container_name}"
-        async_cmd = AsyncCommand.cmd(command)
+        async_cmd = AsyncCommand(["docker", "restart", container_name])
         result = await async_cmd.execute()
 
         return DockerCommandResult(
@@ -74,9 +72,11 @@ class DockerGateway:
 
         cls.logger.info("Deleting container: %s (force=%s)", container_name, force)
 
-        flag = "-f" if force else ""
-        command = f"docker rm {flag} {container_name}".strip()
-        async_cmd = AsyncCommand.cmd(command)
+        command = ["docker", "rm"]
+        if force:
+            command.append("-f")
+        command.append(container_name)
+        async_cmd = AsyncCommand(command)
         result = await async_cmd.execute()
 
         return DockerCommandResult(
@@ -92,9 +92,11 @@ class DockerGateway:
 
         cls.logger.info("Listing containers (all_containers=%s)", all_containers)
 
-        flag = "-a" if all_containers else ""
-        command = f"docker ps {flag} --format json"
-        async_cmd = AsyncCommand.cmd(command)
+        command = ["docker", "ps"]
+        if all_containers:
+            command.append("-a")
+        command.extend(["--format", "json"])
+        async_cmd = AsyncCommand(command)
         result = await async_cmd.execute()
 
         if not result.success:
@@ -153,8 +155,9 @@ class DockerGateway:
         """Get detailed information about the container."""
         self.logger.info("Inspecting container: %s", self.container_name)
 
-        command = f"docker inspect {self.container_name} --format json"
-        async_cmd = AsyncCommand.cmd(command)
+        async_cmd = AsyncCommand(
+            ["docker", "inspect", self.container_name, "--format", "json"]
+        )
         result = await async_cmd.execute()
 
         if not result.success:
@@ -255,8 +258,9 @@ class DockerGateway:
             "Getting logs for container: %s (tail=%d)", self.container_name, tail_lines
         )
 
-        command = f"docker logs --tail {tail_lines} {self.container_name}"
-        async_cmd = AsyncCommand.cmd(command)
+        async_cmd = AsyncCommand(
+            ["docker", "logs", "--tail", str(tail_lines), self.container_name]
+        )
         result = await async_cmd.execute()
 
         return DockerCommandResult(
@@ -272,8 +276,9 @@ class DockerGateway:
             "Running command in container %s: %s", self.container_name, command
         )
 
-        full_command = f"docker exec {self.container_name} {command}"
-        async_cmd = AsyncCommand.cmd(full_command)
+        async_cmd = AsyncCommand(
+            ["docker", "exec", self.container_name, *shlex.split(command)]
+        )
         result = await async_cmd.execute()
 
         return DockerCommandResult(
@@ -16,6 +16,13 @@ class ContainerStatus(str, Enum):
     EXITED = "exited"
     DEAD = "dead"
 
+    @classmethod
+    def _missing_(cls, value):
+        # Accept docker states regardless of case; unknown states stay invalid
+        if isinstance(value, str):
+            return cls._value2member_map_.get(value.lower())
+        return None
+
 
 class HealthStatus(str, Enum):
     """Container health status enumeration."""
@@ -25,6 +32,13 @@ class HealthStatus(str, Enum):
     STARTING = "starting"
     NONE = "none"
 
+    @classmethod
+    def _missing_(cls, value):
+        # Unknown or empty health reports mean no usable health check
+        if isinstance(value, str):
+            return cls._value2member_map_.get(value.lower(), cls.NONE)
+        return cls.NONE
+
 
 class PlatformInfo(BaseModel):
     """Platform information for a container."""
@@ -36,12 +50,12 @@ class PlatformInfo(BaseModel):
 class DockerPsEntry(BaseModel):
     """Represents a single container entry from docker ps --format json."""
 
-    ID: str = Field(..., description="Container ID")
-    Image: str = Field(..., description="Container image")
-    Command: str = Field(..., description="Container command")
-    CreatedAt: str = Field(..., description="Container creation time")
+    ID: str = Field(..., min_length=1, description="Container ID")
+    Image: str = Field(..., min_length=1, description="Container image")
+    Command: str = Field(..., min_length=1, description="Container command")
+    CreatedAt: str = Field(..., min_length=1, description="Container creation time")
     State: str = Field(..., description="Container state (running, exited, etc.)")
-    Status: str = Field(..., description="Container status description")
+    Status: str = Field(..., min_length=1, description="Container status description")
     Ports: str = Field(..., description="Port mappings")
     Names: str = Field(..., description="Container names")
     Labels: str = Field(..., description="Container labels")
@@ -127,16 +141,25 @@ class ContainerInfoResponse(BaseModel):
     error: Optional[str] = None
 
 
+class ContainerInfoListResponse(BaseModel):
+    """Response schema for detailed information about multiple containers."""
+
+    success: bool
+    containers: List[ContainerInfoResponse]
+    total_count: int = 0
+    error: Optional[str] = None
+
+
 class ContainerListResponse(BaseModel):
     """Response schema for container list."""
 
     success: bool
     containers: List[Dict[str, Any]]
-    total_count: int
-    running_count: int
-    stopped_count: int
-    compose_projects: List[str]
-    unique_images: List[str]
+    total_count: int = 0
+    running_count: int = 0
+    stopped_count: int = 0
+    compose_projects: List[str] = []
+    unique_images: List[str] = []
     total_size: Optional[str] = None
     error: Optional[str] = None
 
@@ -159,6 +182,7 @@ class ContainerHealthResponse(BaseModel):
     success: bool
     container_name: str
     health_status: HealthStatus
+    status: Optional[ContainerStatus] = None
     error: Optional[str] = None
 
 
@@ -209,6 +233,7 @@ __all__ = [
     "RemoveContainerRequest",
     "RedeployRequest",
     "ContainerInfoResponse",
+    "ContainerInfoListResponse",
     "ContainerListResponse",
     "ContainerOperationResponse",
     "ContainerHealthResponse",
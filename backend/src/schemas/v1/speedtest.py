@@ -1,14 +1,30 @@
 from datetime import datetime
+from enum import Enum
 from typing import Optional
 
 from pydantic import BaseModel, Field
 
 
+class SpeedTestMode(str, Enum):
+    """How a speed test result was produced."""
+
+    FULL = "full"
+    LIGHT = "light"
+
+
 class SpeedTestRequest(BaseModel):
     """Request to perform a speed test."""
 
+    # A single test takes 20-40 seconds, so shorter intervals saturate the link
     interval_seconds: Optional[int] = Field(
-        default=1, ge=1, le=300, description="Interval between tests in seconds"
+        default=300, ge=30, le=300, description="Interval between tests in seconds"
+    )
+    server_id: Optional[int] = Field(
+        default=None, description="Speedtest server to pin, or None to keep current"
+    )
+    parallel_directions: bool = Field(
+        default=False,
+        description="Measure upload alongside download; faster but may self-congest",
     )
 
 
@@ -24,9 +40,27 @@ class SpeedTestResult(BaseModel):
     ping_ms: Optional[float] = Field(
         default=None, description="Ping latency in milliseconds"
     )
+    ping_baseline_ms: Optional[float] = Field(
+        default=None, description="Idle connect latency to the server in milliseconds"
+    )
+    ping_loaded_ms: Optional[float] = Field(
+        default=None, description="Mean connect latency during download/upload in ms"
+    )
+    ping_loaded_min_ms: Optional[float] = Field(
+        default=None, description="Lowest connect latency during download/upload in ms"
+    )
+    ping_loaded_p95_ms: Optional[float] = Field(
+        default=None, description="95th percentile connect latency under load in ms"
+    )
+    bufferbloat_ms: Optional[float] = Field(
+        default=None, description="Latency added while the link is saturated in ms"
+    )
     timestamp: Optional[datetime] = Field(
         default=None, description="When the test was performed"
     )
+    ping_timestamp: Optional[datetime] = Field(
+        default=None, description="When the ping was last measured"
+    )
     server_name: Optional[str] = Field(
         default=None, description="Name of the test server"
     )
@@ -42,6 +76,10 @@ class SpeedTestResult(BaseModel):
     is_ping_complete: bool = Field(
         default=False, description="Whether ping test is complete"
     )
+    test_mode: Optional[SpeedTestMode] = Field(
+        default=None,
+        description="full measured throughput; light only refreshed the ping",
+    )
 
 
 class SpeedTestResponse(BaseModel):
@@ -72,6 +110,7 @@ class SpeedTestConfigResponse(BaseModel):
 
 
 __all__ = [
+    "SpeedTestMode",
     "SpeedTestRequest",
     "SpeedTestResult",
     "SpeedTestResponse",
@@ -1,8 +1,27 @@
 import asyncio
-from typing import List, Optional
+import contextlib
+import functools
+import json
+import math
+import os
+import shlex
+import time
+from types import MappingProxyType
+from typing import (
+    AsyncIterator,
+    Dict,
+    Hashable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+
+from pydantic import TypeAdapter, ValidationError
 
 from ...schemas.v1.docker import (
     ContainerHealthResponse,
+    ContainerInfoListResponse,
     ContainerInfoResponse,
     ContainerListResponse,
     ContainerLogsResponse,
@@ -17,226 +36,490 @@ from ...schemas.v1.docker import (
     RedeployRequest,
     RemoveContainerRequest,
 )
-from ...utils.command import AsyncCommand, CommandType
+from ...utils.command import AsyncCommand, CommandExecutionResult, CommandType
 from ...utils.logger import get_logger
 from .base_service import BaseService
 
+try:
+    # orjson raises a json.JSONDecodeError subclass, so error handling is shared
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+_PS_ENTRIES_ADAPTER = TypeAdapter(List[DockerPsEntry])
+
+_COMPOSE_LABEL_MAP = MappingProxyType(
+    {
+        "com.docker.compose.project": "project",
+        "com.docker.compose.service": "service",
+        "com.docker.compose.config-hash": "config_hash",
+        "com.docker.compose.container-number": "container_number",
+        "com.docker.compose.depends_on": "depends_on",
+        "com.docker.compose.version": "version",
+        "com.docker.compose.project.config_files": "config_files",
+        "com.docker.compose.project.working_dir": "working_dir",
+    }
+)
+
+# Seconds a cached docker inspect / docker ps result is served before refetching
+_INFO_CACHE_TTL = 5.0
+_LIST_CACHE_TTL = 2.0
+
+# (previous status, status after success) reported by batch operations
+_BATCH_OPERATION_STATUSES = MappingProxyType(
+    {
+        "stop": (ContainerStatus.RUNNING, ContainerStatus.STOPPED),
+        "start": (ContainerStatus.STOPPED, ContainerStatus.RUNNING),
+        "restart": (ContainerStatus.RUNNING, ContainerStatus.RUNNING),
+    }
+)
+
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+
+# Upper bound on docker CLI processes this service runs at the same time,
+# configurable through the DOCKER_MAX_CONCURRENCY environment variable
+_DEFAULT_MAX_CONCURRENT_COMMANDS = 16
+
+
+def _read_max_concurrent_commands() -> int:
+    """Read DOCKER_MAX_CONCURRENCY, falling back to the default if it is invalid."""
+    raw = os.environ.get("DOCKER_MAX_CONCURRENCY")
+    if raw is None:
+        return _DEFAULT_MAX_CONCURRENT_COMMANDS
+    try:
+        return max(1, int(raw))
+    except ValueError:
+        get_logger(__name__).warning(
+            "Invalid DOCKER_MAX_CONCURRENCY %r, using %d",
+            raw,
+            _DEFAULT_MAX_CONCURRENT_COMMANDS,
+        )
+        return _DEFAULT_MAX_CONCURRENT_COMMANDS
+
+
+_MAX_CONCURRENT_COMMANDS = _read_max_concurrent_commands()
+
 
 class DockerService(BaseService):
     """Service for managing Docker containers using AsyncCommand."""
 
+    def __init__(self):
+        # Cached entries expire after a short TTL, unless the docker events
+        # stream is watched, in which case they live until a container changes
+        self._info_cache: Dict[str, Tuple[float, ContainerInfoResponse]] = {}
+        self._list_cache: Dict[bool, Tuple[float, ContainerListResponse]] = {}
+        # Per-key lock and the number of callers holding or awaiting it
+        self._cache_locks: Dict[Hashable, Tuple[asyncio.Lock, int]] = {}
+        self._cache_generation = 0
+        self._command_slots = asyncio.Semaphore(_MAX_CONCURRENT_COMMANDS)
+        self._event_watcher: Optional[asyncio.Task] = None
+
+    @property
+    def is_watching_events(self) -> bool:
+        """Whether the docker events stream is currently being watched."""
+        return self._event_watcher is not None and not self._event_watcher.done()
+
+    @property
+    def _info_cache_ttl(self) -> float:
+        """Seconds cached docker inspect results are served."""
+        # While the events stream is watched it invalidates info on every
+        # container change. Listings always use their ttl, because status text,
+        # running time and sizes change without an event.
+        return math.inf if self.is_watching_events else _INFO_CACHE_TTL
+
+    def start_event_watcher(self) -> None:
+        """Start watching docker events to keep cached container info fresh."""
+        if self.is_watching_events:
+            return
+        self.logger.info("Starting docker events watcher")
+        # Entries cached before the stream was watched may already be stale
+        self._clear_cache()
+        self._event_watcher = asyncio.create_task(self._watch_events())
+
+    async def stop_event_watcher(self) -> None:
+        """Stop watching docker events and drop everything cached meanwhile."""
+        if self._event_watcher is None:
+            return
+        self.logger.info("Stopping docker events watcher")
+        self._event_watcher.cancel()
+        try:
+            await self._event_watcher
+        except asyncio.CancelledError:
+            pass
+        self._event_watcher = None
+        self._clear_cache()
+
+    async def _watch_events(self) -> None:
+        """Invalidate cached container info for every container event."""
+        command = [
+            "docker",
+            "events",
+            "--filter",
+            "type=container",
+            "--format",
+            "{{json .}}",
+        ]
+        async_cmd = AsyncCommand(command)
+        try:
+            async for line in async_cmd.stream_lines():
+                try:
+                    event = _json_loads(line)
+                except json.JSONDecodeError:
+                    continue
+                actor = event.get("Actor") or {}
+                self._invalidate_container(
+                    (actor.get("Attributes") or {}).get("name"), actor.get("ID")
+                )
+        finally:
+            # Nothing keeps the cache fresh once the stream is gone
+            self._clear_cache()
+
+        self.logger.warning(
+            "Docker events stream ended: %s",
+            async_cmd.result.stderr if async_cmd.result else "",
+        )
+
+    def _invalidate_container(
+        self, container_name: Optional[str], container_id: Optional[str] = None
+    ) -> None:
+        """Drop cached info for a container, matched by name or by ID."""
+        self._cache_generation += 1
+        for key, (_, info) in list(self._info_cache.items()):
+            if key == container_name or (
+                container_id and info.container_id == container_id
+            ):
+                del self._info_cache[key]
+        # Any container change can alter the listing
+        self._list_cache.clear()
+
+    def _clear_cache(self) -> None:
+        """Drop all cached container info."""
+        self._cache_generation += 1
+        self._info_cache.clear()
+        self._list_cache.clear()
+
+    @contextlib.asynccontextmanager
+    async def _cache_lock(self, key: Hashable) -> AsyncIterator[None]:
+        """Hold the lock that coalesces concurrent cache misses for a key."""
+        lock, users = self._cache_locks.get(key, (asyncio.Lock(), 0))
+        self._cache_locks[key] = (lock, users + 1)
+        try:
+            async with lock:
+                yield
+        finally:
+            lock, users = self._cache_locks[key]
+            if users == 1:
+                # Nobody else is waiting, so keeping the lock would only grow the
+                # dict with every container name ever looked up
+                del self._cache_locks[key]
+            else:
+                self._cache_locks[key] = (lock, users - 1)
+
+    def _get_fresh(self, cache: dict, key: Hashable, ttl: float):
+        """Get a cached value if it is still valid, else None."""
+        entry = cache.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() - entry[0] < ttl:
+            return entry[1]
+        return None
+
+    async def _run_command(self, command: List[str]) -> CommandExecutionResult:
+        """Run a docker command once one of the bounded process slots is free."""
+        self.logger.debug("Executing command: %s", command)
+        async with self._command_slots:
+            return await AsyncCommand(command).execute()
+
     async def get_container_info(self, container_name: str) -> ContainerInfoResponse:
         """Get detailed information about a specific Docker container."""
         self.logger.info("Getting container info for: %s", container_name)
 
-        try:
-            # Get detailed container information using docker inspect with JSON format
-            command = f"docker inspect {container_name} --format json"
-            self.logger.debug("Executing command: %s", command)
-            async_cmd = AsyncCommand.cmd(command)
-            result = await async_cmd.execute()
+        cached = self._get_fresh(self._info_cache, container_name, self._info_cache_ttl)
+        if cached is not None:
+            self.logger.debug("Serving cached container info for: %s", container_name)
+            return cached
 
-            if result.success:
-                self.logger.debug("Successfully executed docker inspect command")
-                try:
-                    import json
-
-                    container_data = json.loads(result.stdout)
-                    self.logger.debug("Successfully parsed container data JSON")
-
-                    # Extract all the rich information from the inspect output
-                    container_id = container_data.get("Id", "")
-                    image = container_data.get("Config", {}).get("Image", "")
-                    image_id = container_data.get("Image", "")
-                    created = container_data.get("Created", "")
-                    state = container_data.get("State", {})
-                    status = state.get("Status", "")
-                    health_status = (
-                        state.get("Health", {}).get("Status")
-                        if state.get("Health")
-                        else None
+        # Concurrent misses for the same container wait on a single docker inspect
+        async with self._cache_lock(("info", container_name)):
+            cached = self._get_fresh(
+                self._info_cache, container_name, self._info_cache_ttl
+            )
+            if cached is not None:
+                return cached
+
+            # An invalidation while inspecting makes this result stale on arrival
+            generation = self._cache_generation
+            info = await self._inspect_container_info(container_name)
+            if info.success and generation == self._cache_generation:
+                self._info_cache[container_name] = (time.monotonic(), info)
+            return info
+
+    async def batch_container_info(
+        self, container_names: List[str]
+    ) -> List[ContainerInfoResponse]:
+        """Get information about several containers with a single docker inspect."""
+        self.logger.info("Getting container info for: %s", container_names)
+
+        infos: Dict[str, ContainerInfoResponse] = {}
+        missing = []
+        for name in dict.fromkeys(container_names):
+            cached = self._get_fresh(self._info_cache, name, self._info_cache_ttl)
+            if cached is not None:
+                infos[name] = cached
+            else:
+                missing.append(name)
+
+        if missing:
+            generation = self._cache_generation
+            result = await self._run_command(["docker", "inspect", *missing])
+
+            # docker inspect still prints the containers it found when some are gone
+            by_name: Dict[str, dict] = {}
+            by_id: Dict[str, dict] = {}
+            try:
+                for container_data in _json_loads(result.stdout or "[]"):
+                    by_name[container_data.get("Name", "").lstrip("/")] = container_data
+                    by_id[container_data.get("Id", "")] = container_data
+            except json.JSONDecodeError as e:
+                self.logger.warning("Failed to parse docker inspect output: %s", str(e))
+
+            now = time.monotonic()
+            for name in missing:
+                container_data = by_name.get(name) or next(
+                    (data for id_, data in by_id.items() if id_.startswith(name)),
+                    None,
+                )
+                if container_data is None:
+                    infos[name] = ContainerInfoResponse(
+                        success=False,
+                        container_name=name,
+                        message=f"Failed to get container information for {name}",
+                        error=result.stderr or None,
                     )
+                    continue
 
-                    # Extract ports
-                    ports = []
-                    network_settings = container_data.get("NetworkSettings", {})
-                    if "Ports" in network_settings:
-                        for port_binding, host_bindings in network_settings[
-                            "Ports"
-                        ].items():
-                            if host_bindings:
-                                for host_binding in host_bindings:
-                                    ports.append(
-                                        {
-                                            "container_port": port_binding,
-                                            "host_ip": host_binding.get("HostIp", ""),
-                                            "host_port": host_binding.get(
-                                                "HostPort", ""
-                                            ),
-                                        }
-                                    )
-
-                    # Extract mounts
-                    mounts = []
-                    for mount in container_data.get("Mounts", []):
-                        mounts.append(
-                            {
-                                "source": mount.get("Source", ""),
-                                "destination": mount.get("Destination", ""),
-                                "type": mount.get("Type", ""),
-                                "read_only": mount.get("RW", True),
-                            }
-                        )
+                info = self._build_container_info(name, container_data)
+                infos[name] = info
+                if generation == self._cache_generation:
+                    self._info_cache[name] = (now, info)
 
-                    # Extract networks
-                    networks = []
-                    if "Networks" in network_settings:
-                        networks = list(network_settings["Networks"].keys())
-
-                    # Extract environment variables
-                    env_vars = {}
-                    for env in container_data.get("Config", {}).get("Env", []):
-                        if "=" in env:
-                            key, value = env.split("=", 1)
-                            env_vars[key] = value
-
-                    # Extract command and entrypoint
-                    command = container_data.get("Config", {}).get("Cmd", [])
-                    entrypoint = container_data.get("Config", {}).get("Entrypoint", [])
-                    working_dir = container_data.get("Config", {}).get("WorkingDir", "")
-                    user = container_data.get("Config", {}).get("User", "")
-
-                    # Extract compose information from labels
-                    labels = container_data.get("Config", {}).get("Labels", {})
-                    compose_info = self._parse_compose_labels_from_dict(labels)
-
-                    # Build deploy command based on available information
-                    deploy_command = self._build_deploy_command_from_inspect(
-                        container_data
-                    )
+        return [infos[name] for name in container_names]
 
-                    self.logger.info(
-                        "Successfully retrieved container info for: %s", container_name
-                    )
-                    return ContainerInfoResponse(
-                        success=True,
-                        container_name=container_name,
-                        container_id=container_id,
-                        status=self._parse_status(status),
-                        image=image,
-                        image_id=image_id,
-                        created=created,
-                        ports=ports,
-                        mounts=mounts,
-                        networks=networks,
-                        health_status=self._parse_health_status(health_status),
-                        environment_vars=env_vars,
-                        command=command,
-                        entrypoint=entrypoint,
-                        working_dir=working_dir,
-                        user=user,
-                        deploy_command=deploy_command,
-                        compose_file=compose_info.get("config_files"),
-                        compose_service=compose_info.get("service"),
-                        restart_policy=container_data.get("HostConfig", {})
-                        .get("RestartPolicy", {})
-                        .get("Name"),
-                        error=None,
-                    )
+    async def _inspect_container_info(
+        self, container_name: str
+    ) -> ContainerInfoResponse:
+        """Get detailed container information straight from docker inspect."""
+        # Get detailed container information using docker inspect with JSON format
+        command = ["docker", "inspect", container_name, "--format", "json"]
+        result = await self._run_command(command)
 
-                except json.JSONDecodeError as e:
-                    self.logger.error(
-                        "Failed to parse container JSON for %s: %s",
-                        container_name,
-                        str(e),
-                    )
-                    return ContainerInfoResponse(
-                        success=False,
-                        container_name=container_name,
-                        message=f"Failed to parse container information: {str(e)}",
-                        error=f"JSON decode error: {str(e)}",
-                    )
-            else:
-                self.logger.error(
-                    "Failed to execute docker inspect for %s: %s",
-                    container_name,
-                    result.stderr,
-                )
-                return ContainerInfoResponse(
-                    success=False,
-                    container_name=container_name,
-                    message=f"Failed to get container information for {container_name}",
-                    error=result.stderr,
-                )
-        except Exception as e:
+        if not result.success:
             self.logger.error(
-                "Error getting container info for %s: %s", container_name, str(e)
+                "Failed to execute docker inspect for %s: %s",
+                container_name,
+                result.stderr,
             )
             return ContainerInfoResponse(
                 success=False,
                 container_name=container_name,
-                message=f"Error getting container information for {container_name}",
-                error=str(e),
+                message=f"Failed to get container information for {container_name}",
+                error=result.stderr,
+            )
+        self.logger.debug("Successfully executed docker inspect command")
+
+        try:
+            container_data = _json_loads(result.stdout)
+        except json.JSONDecodeError as e:
+            self.logger.error(
+                "Failed to parse container JSON for %s: %s", container_name, str(e)
             )
+            return ContainerInfoResponse(
+                success=False,
+                container_name=container_name,
+                message=f"Failed to parse container information: {str(e)}",
+                error=f"JSON decode error: {str(e)}",
+            )
+        self.logger.debug("Successfully parsed container data JSON")
+
+        self.logger.info(
+            "Successfully retrieved container info for: %s", container_name
+        )
+        return self._build_container_info(container_name, container_data)
+
+    async def list_containers_detailed(
+        self, all_containers: bool = True
+    ) -> ContainerInfoListResponse:
+        """Get detailed information about every container with two docker calls."""
+        self.logger.info(
+            "Listing detailed containers (all_containers=%s)", all_containers
+        )
+
+        # Collect the full IDs first, then inspect all of them in one call
+        command = ["docker", "ps", "-q", "--no-trunc"]
+        if all_containers:
+            command.append("-a")
+        ps_result = await self._run_command(command)
+        if not ps_result.success:
+            self.logger.error(
+                "Failed to execute docker ps command: %s", ps_result.stderr
+            )
+            return ContainerInfoListResponse(
+                success=False, containers=[], error=ps_result.stderr
+            )
+
+        container_ids = ps_result.stdout.split()
+        if not container_ids:
+            return ContainerInfoListResponse(success=True, containers=[])
+
+        command = ["docker", "inspect", *container_ids]
+        inspect_result = await self._run_command(command)
+        if not inspect_result.success:
+            self.logger.error(
+                "Failed to execute docker inspect command: %s",
+                inspect_result.stderr,
+            )
+            return ContainerInfoListResponse(
+                success=False, containers=[], error=inspect_result.stderr
+            )
+
+        # Only malformed docker output is expected here; anything else is a bug
+        try:
+            inspected = _json_loads(inspect_result.stdout)
+        except json.JSONDecodeError as e:
+            self.logger.error("Failed to parse docker inspect output: %s", str(e))
+            return ContainerInfoListResponse(
+                success=False, containers=[], error=f"JSON decode error: {str(e)}"
+            )
+
+        containers = [
+            self._build_container_info(
+                container_data.get("Name", "").lstrip("/"), container_data
+            )
+            for container_data in inspected
+        ]
+
+        self.logger.info("Successfully listed %d detailed containers", len(containers))
+        return ContainerInfoListResponse(
+            success=True,
+            containers=containers,
+            total_count=len(containers),
+        )
+
+    def _build_container_info(
+        self, container_name: str, container_data: dict
+    ) -> ContainerInfoResponse:
+        """Build a ContainerInfoResponse from a single docker inspect entry"""
+        # Bind the nested sections once; docker reports missing ones as null
+        config = container_data.get("Config") or {}
+        state = container_data.get("State") or {}
+        network_settings = container_data.get("NetworkSettings") or {}
+        host_config = container_data.get("HostConfig") or {}
+
+        # Extract all the rich information from the inspect output
+        container_id = container_data.get("Id", "")
+        image = config.get("Image", "")
+        image_id = container_data.get("Image", "")
+        created = container_data.get("Created", "")
+        status = state.get("Status", "")
+        health_status = (state.get("Health") or {}).get("Status")
+
+        # Extract ports
+        ports = []
+        if network_settings.get("Ports"):
+            for port_binding, host_bindings in network_settings["Ports"].items():
+                if host_bindings:
+                    for host_binding in host_bindings:
+                        ports.append(
+                            {
+                                "container_port": port_binding,
+                                "host_ip": host_binding.get("HostIp", ""),
+                                "host_port": host_binding.get("HostPort", ""),
+                            }
+                        )
+
+        # Extract mounts
+        mounts = []
+        for mount in container_data.get("Mounts") or []:
+            mounts.append(
+                {
+                    "source": mount.get("Source", ""),
+                    "destination": mount.get("Destination", ""),
+                    "type": mount.get("Type", ""),
+                    "read_only": not mount.get("RW", True),
+                }
+            )
+
+        # Extract networks
+        networks = list((network_settings.get("Networks") or {}).keys())
+
+        # Extract environment variables
+        env_vars = {}
+        for env in config.get("Env") or []:
+            if "=" in env:
+                key, value = env.split("=", 1)
+                env_vars[key] = value
+
+        # Extract command and entrypoint
+        command = config.get("Cmd", [])
+        entrypoint = config.get("Entrypoint", [])
+        working_dir = config.get("WorkingDir", "")
+        user = config.get("User", "")
+
+        # Extract compose information from labels
+        labels = config.get("Labels") or {}
+        compose_info = self._parse_compose_labels_from_dict(labels)
+
+        # Build deploy command based on available information
+        deploy_command = self._build_deploy_command_from_inspect(container_data)
+
+        return ContainerInfoResponse(
+            success=True,
+            container_name=container_name,
+            container_id=container_id,
+            # Pydantic coerces the raw docker strings through the enums
+            status=status or None,
+            image=image,
+            image_id=image_id,
+            created=created,
+            ports=ports,
+            mounts=mounts,
+            networks=networks,
+            health_status=health_status or HealthStatus.NONE,
+            environment_vars=env_vars,
+            command=command,
+            entrypoint=entrypoint,
+            working_dir=working_dir,
+            user=user,
+            deploy_command=deploy_command,
+            compose_file=compose_info.get("config_files"),
+            compose_service=compose_info.get("service"),
+            restart_policy=(host_config.get("RestartPolicy") or {}).get("Name"),
+        )
 
     def _parse_status(self, status_str: Optional[str]) -> Optional[ContainerStatus]:
         """Parse container status string to ContainerStatus enum"""
         if not status_str:
             return None
 
-        status_mapping = {
-            "running": ContainerStatus.RUNNING,
-            "stopped": ContainerStatus.STOPPED,
-            "paused": ContainerStatus.PAUSED,
-            "restarting": ContainerStatus.RESTARTING,
-            "removing": ContainerStatus.REMOVING,
-            "created": ContainerStatus.CREATED,
-            "exited": ContainerStatus.EXITED,
-            "dead": ContainerStatus.DEAD,
-        }
-
-        return status_mapping.get(status_str.lower(), None)
+        try:
+            return ContainerStatus(status_str)
+        except ValueError:
+            return None
 
     def _parse_compose_labels_from_dict(self, labels: dict) -> dict:
         """Parse docker-compose labels from a dictionary"""
-        compose_info = {}
-
-        for key, value in labels.items():
-            if key.startswith("com.docker.compose."):
-                if key == "com.docker.compose.project":
-                    compose_info["project"] = value
-                elif key == "com.docker.compose.service":
-                    compose_info["service"] = value
-                elif key == "com.docker.compose.config-hash":
-                    compose_info["config_hash"] = value
-                elif key == "com.docker.compose.container-number":
-                    compose_info["container_number"] = value
-                elif key == "com.docker.compose.depends_on":
-                    compose_info["depends_on"] = value
-                elif key == "com.docker.compose.version":
-                    compose_info["version"] = value
-                elif key == "com.docker.compose.project.config_files":
-                    compose_info["config_files"] = value
-                elif key == "com.docker.compose.project.working_dir":
-                    compose_info["working_dir"] = value
-
-        return compose_info
-
-    def _parse_health_status(
-        self, health_status: Optional[str]
-    ) -> Optional[HealthStatus]:
+        return {
+            short_name: labels[label]
+            for label, short_name in _COMPOSE_LABEL_MAP.items()
+            if label in labels
+        }
+
+    def _parse_health_status(self, health_status: Optional[str]) -> HealthStatus:
         """Parse health status string to HealthStatus enum"""
         if not health_status:
-            return None
-
-        status_mapping = {
-            "healthy": HealthStatus.HEALTHY,
-            "unhealthy": HealthStatus.UNHEALTHY,
-            "starting": HealthStatus.STARTING,
-            "none": HealthStatus.NONE,
-        }
+            return HealthStatus.NONE
 
-        return status_mapping.get(health_status.lower(), HealthStatus.NONE)
+        return HealthStatus(health_status)
 
     def _build_deploy_command(self, container_name: str, image: Optional[str]) -> str:
         """Build a docker run command for redeployment"""
@@ -248,74 +531,72 @@ class DockerService(BaseService):
 
     def _build_deploy_command_from_inspect(self, container_data: dict) -> str:
         """Build a comprehensive docker run command from inspect data"""
-        cmd_parts = ["docker", "run", "-d"]
+        return shlex.join(self._iter_deploy_args(container_data))
+
+    def _iter_deploy_args(self, container_data: dict) -> Iterator[str]:
+        """Yield the docker run arguments that recreate an inspected container"""
+        config = container_data.get("Config") or {}
+        network_settings = container_data.get("NetworkSettings") or {}
+        host_config = container_data.get("HostConfig") or {}
+
+        yield from ("docker", "run", "-d")
 
         # Container name
         name = container_data.get("Name", "").lstrip("/")
         if name:
-            cmd_parts.extend(["--name", name])
-
-        # Image
-        image = container_data.get("Config", {}).get("Image", "")
-        if image:
-            cmd_parts.append(image)
+            yield from ("--name", name)
 
         # Ports
-        network_settings = container_data.get("NetworkSettings", {})
-        if "Ports" in network_settings:
-            for port_binding, host_bindings in network_settings["Ports"].items():
-                if host_bindings:
-                    for host_binding in host_bindings:
-                        host_ip = host_binding.get("HostIp", "")
-                        host_port = host_binding.get("HostPort", "")
-                        if host_ip and host_ip != "0.0.0.0":
-                            cmd_parts.extend(
-                                ["-p", f"{host_ip}:{host_port}:{port_binding}"]
-                            )
-                        else:
-                            cmd_parts.extend(["-p", f"{host_port}:{port_binding}"])
+        ports = network_settings.get("Ports") or {}
+        for port_binding, host_bindings in ports.items():
+            for host_binding in host_bindings or []:
+                host_ip = host_binding.get("HostIp", "")
+                host_port = host_binding.get("HostPort", "")
+                yield "-p"
+                if host_ip and host_ip != "0.0.0.0":
+                    yield f"{host_ip}:{host_port}:{port_binding}"
+                else:
+                    yield f"{host_port}:{port_binding}"
 
         # Volumes
-        for mount in container_data.get("Mounts", []):
+        for mount in container_data.get("Mounts") or []:
             mount_type = mount.get("Type", "")
+            destination = mount.get("Destination", "")
             if mount_type == "bind":
                 source = mount.get("Source", "")
-                destination = mount.get("Destination", "")
-                read_only = mount.get("RW", True)
+                # RW is true for read-write mounts, so only a false value is :ro
+                ro_flag = "" if mount.get("RW", True) else ":ro"
                 if source and destination:
-                    ro_flag = ":ro" if not read_only else ""
-                    cmd_parts.extend(["-v", f"{source}:{destination}{ro_flag}"])
+                    yield from ("-v", f"{source}:{destination}{ro_flag}")
             elif mount_type == "volume":
                 source = mount.get("Name", "")
-                destination = mount.get("Destination", "")
                 if source and destination:
-                    cmd_parts.extend(["-v", f"{source}:{destination}"])
+                    yield from ("-v", f"{source}:{destination}")
 
         # Environment variables
-        for env in container_data.get("Config", {}).get("Env", []):
+        for env in config.get("Env") or []:
             if "=" in env:
-                cmd_parts.extend(["-e", env])
+                yield from ("-e", env)
 
         # Working directory
-        working_dir = container_data.get("Config", {}).get("WorkingDir", "")
+        working_dir = config.get("WorkingDir", "")
         if working_dir:
-            cmd_parts.extend(["-w", working_dir])
+            yield from ("-w", working_dir)
 
         # User
-        user = container_data.get("Config", {}).get("User", "")
+        user = config.get("User", "")
         if user:
-            cmd_parts.extend(["-u", user])
+            yield from ("-u", user)
 
         # Restart policy
-        restart_policy = (
-            container_data.get("HostConfig", {})
-            .get("RestartPolicy", {})
-            .get("Name", "")
-        )
+        restart_policy = (host_config.get("RestartPolicy") or {}).get("Name", "")
         if restart_policy and restart_policy != "no":
-            cmd_parts.extend(["--restart", restart_policy])
+            yield from ("--restart", restart_policy)
 
-        return " ".join(cmd_parts)
+        # Image goes last, anything after it is passed to the container command
+        image = config.get("Image", "")
+        if image:
+            yield image
 
     async def list_containers(
         self, all_containers: bool = False
@@ -323,285 +604,217 @@ class DockerService(BaseService):
         """List all Docker containers."""
         self.logger.info("Listing containers (all_containers=%s)", all_containers)
 
-        try:
-            flag = "-a" if all_containers else ""
-            command = f"docker ps {flag} --format json"
-            self.logger.debug("Executing command: %s", command)
-            async_cmd = AsyncCommand.cmd(command)
-            result = await async_cmd.execute()
+        cached = self._get_fresh(self._list_cache, all_containers, _LIST_CACHE_TTL)
+        if cached is not None:
+            self.logger.debug("Serving cached container list")
+            return cached
+
+        # Concurrent misses wait on a single docker ps / docker inspect round
+        async with self._cache_lock(("list", all_containers)):
+            cached = self._get_fresh(self._list_cache, all_containers, _LIST_CACHE_TTL)
+            if cached is not None:
+                return cached
+
+            generation = self._cache_generation
+            response = await self._fetch_container_list(all_containers)
+            if response.success and generation == self._cache_generation:
+                self._list_cache[all_containers] = (time.monotonic(), response)
+            return response
+
+    async def _fetch_container_list(
+        self, all_containers: bool
+    ) -> ContainerListResponse:
+        """List Docker containers straight from docker ps and docker inspect."""
+        command = ["docker", "ps"]
+        if all_containers:
+            command.append("-a")
+        command.extend(["--format", "json"])
+        result = await self._run_command(command)
+
+        if not result.success:
+            self.logger.error("Failed to execute docker ps command: %s", result.stderr)
+            return ContainerListResponse(
+                success=False, containers=[], error=result.stderr
+            )
 
-            if result.success:
-                self.logger.debug("Successfully executed docker ps command")
-                # Parse JSON output for each container
-                docker_entries = []
-                lines = result.stdout.strip().split("\n")
-                for line in lines:
-                    if line.strip():
-                        try:
-                            import json
-
-                            container_data = json.loads(line)
-                            docker_entries.append(DockerPsEntry(**container_data))
-                        except json.JSONDecodeError as e:
-                            # Handle cases where line might not be a valid JSON object
-                            # For example, if it's a header or an error message
-                            pass
-
-                # Filter out any non-container lines (like headers or errors)
-                docker_entries = [
-                    c
-                    for c in docker_entries
-                    if c.ID and c.Image and c.Command and c.CreatedAt and c.Status
-                ]
+        self.logger.debug("Successfully executed docker ps command")
+        # Parse JSON output for each container
+        # Headers and error messages are skipped without parsing them
+        docker_entries = self._parse_ps_entries(
+            [line for line in result.stdout.splitlines() if line.startswith("{")]
+        )
 
-                # Track summary information
-                compose_projects = set()
-                unique_images = set()
-                total_size_bytes = 0
-                running_count = 0
-                stopped_count = 0
+        # Track summary information
+        compose_projects = set()
+        unique_images = set()
+        add_compose_project = compose_projects.add
+        add_unique_image = unique_images.add
+        total_size_bytes = 0
 
-                # Convert to response format
-                containers = []
+        # Convert to response format
+        containers = []
 
-                # Get container details concurrently for better performance
-                container_details_tasks = [
-                    self._get_container_details(container.ID, container.Names)
-                    for container in docker_entries
-                ]
-                container_details_results = await asyncio.gather(
-                    *container_details_tasks, return_exceptions=True
-                )
+        # Inspect every listed container with a single docker call
+        inspect_by_id = await self._inspect_containers(
+            [container.ID for container in docker_entries]
+        )
 
-                for i, container in enumerate(docker_entries):
-                    # Get container details (handle any exceptions)
-                    container_details = {}
-                    if i < len(container_details_results):
-                        result = container_details_results[i]
-                        if isinstance(result, Exception):
-                            # If getting details failed, continue with basic info
-                            pass
-                        else:
-                            container_details = result
-
-                    # Parse compose information from labels
-                    compose_info = self._parse_compose_labels(container.Labels)
-
-                    container_info = {
-                        "id": container.ID,
-                        "image": container.Image,
-                        "command": container.Command,
-                        "created": container.CreatedAt,
-                        "state": container.State,
-                        "status": container.Status,
-                        "ports": container.Ports,
-                        "names": container.Names,
-                        "running_for": container.RunningFor,
-                        "size": container.Size,
-                        # Additional details from inspect
-                        "container_name": container_details.get(
-                            "name", container.Names
-                        ),
-                        "compose_project": container_details.get("compose_project"),
-                        "compose_service": container_details.get("compose_service"),
-                        "image_tag": container_details.get("image_tag"),
-                        "health_status": container_details.get("health_status"),
-                        "mounts": container_details.get("mounts"),
-                        "networks": container_details.get("networks"),
-                        # Rich data from JSON format
-                        "labels": container.Labels,
-                        "local_volumes": container.LocalVolumes,
-                        "platform": {
-                            "architecture": container.Platform.architecture,
-                            "os": container.Platform.os,
-                        },
-                        # Compose information from labels
-                        "compose_project": compose_info.get("project"),
-                        "compose_service": compose_info.get("service"),
-                        "compose_config_hash": compose_info.get("config_hash"),
-                        "compose_container_number": compose_info.get(
-                            "container_number"
-                        ),
-                        "compose_depends_on": compose_info.get("depends_on"),
-                        "compose_version": compose_info.get("version"),
-                        "compose_config_files": compose_info.get("config_files"),
-                        "compose_working_dir": compose_info.get("working_dir"),
-                    }
-                    containers.append(container_info)
-
-                    # Update summary information
-                    if compose_info.get("project"):
-                        compose_projects.add(compose_info["project"])
-                    if container.Image:
-                        unique_images.add(container.Image)
-                    if container_details.get("size"):
-                        # Try to parse size for total calculation
-                        size_str = container_details["size"]
-                        try:
-                            if "KB" in size_str:
-                                total_size_bytes += (
-                                    float(size_str.replace(" KB", "")) * 1024
-                                )
-                            elif "MB" in size_str:
-                                total_size_bytes += (
-                                    float(size_str.replace(" MB", "")) * 1024 * 1024
-                                )
-                            elif "GB" in size_str:
-                                total_size_bytes += (
-                                    float(size_str.replace(" GB", ""))
-                                    * 1024
-                                    * 1024
-                                    * 1024
-                                )
-                            elif (
-                                "B" in size_str
-                                and "KB" not in size_str
-                                and "MB" not in size_str
-                                and "GB" not in size_str
-                            ):
-                                total_size_bytes += float(size_str.replace(" B", ""))
-                        except ValueError:
-                            pass
-
-                    if container.State == "running":
-                        running_count += 1
-                    else:
-                        stopped_count += 1
-
-                self.logger.info(
-                    "Successfully listed %d containers (%d running, %d stopped)",
-                    len(containers),
-                    running_count,
-                    stopped_count,
-                )
-                return ContainerListResponse(
-                    success=True,
-                    containers=containers,
-                    total_count=len(containers),
-                    running_count=running_count,
-                    stopped_count=stopped_count,
-                    compose_projects=list(compose_projects),
-                    unique_images=list(unique_images),
-                    total_size=None,  # Size is per-container in JSON format
-                    error=None,
-                )
-            else:
-                self.logger.error(
-                    "Failed to execute docker ps command: %s", result.stderr
-                )
-                return ContainerListResponse(
-                    success=False, containers=[], error=result.stderr
-                )
-        except Exception as e:
-            self.logger.error("Error listing containers: %s", str(e))
-            return ContainerListResponse(success=False, containers=[], error=str(e))
+        for container in docker_entries:
+            container_details = self._extract_container_details(
+                container.Names, inspect_by_id.get(container.ID[:12])
+            )
 
-    async def _get_container_details(self, container_id: str, names: str) -> dict:
-        """Get additional container details using docker inspect"""
-        details = {}
+            # Parse compose information from labels
+            compose_info = self._parse_compose_labels(container.Labels)
+
+            container_info = {
+                "id": container.ID,
+                "image": container.Image,
+                "command": container.Command,
+                "created": container.CreatedAt,
+                "state": container.State,
+                "status": container.Status,
+                "ports": container.Ports,
+                "names": container.Names,
+                "running_for": container.RunningFor,
+                "size": container.Size,
+                # Additional details from inspect
+                "container_name": container_details.get("name", container.Names),
+                "image_tag": container_details.get("image_tag"),
+                "health_status": container_details.get("health_status"),
+                "mounts": container_details.get("mounts"),
+                "networks": container_details.get("networks"),
+                # Rich data from JSON format
+                "labels": container.Labels,
+                "local_volumes": container.LocalVolumes,
+                "platform": {
+                    "architecture": container.Platform.architecture,
+                    "os": container.Platform.os,
+                },
+                # Compose information from labels
+                "compose_project": compose_info.get("project"),
+                "compose_service": compose_info.get("service"),
+                "compose_config_hash": compose_info.get("config_hash"),
+                "compose_container_number": compose_info.get("container_number"),
+                "compose_depends_on": compose_info.get("depends_on"),
+                "compose_version": compose_info.get("version"),
+                "compose_config_files": compose_info.get("config_files"),
+                "compose_working_dir": compose_info.get("working_dir"),
+            }
+            containers.append(container_info)
+
+            # Update summary information
+            if compose_info.get("project"):
+                add_compose_project(compose_info["project"])
+            if container.Image:
+                add_unique_image(container.Image)
+            total_size_bytes += container_details.get("size_bytes", 0)
+
+        running_count = sum(entry.State == "running" for entry in docker_entries)
+        stopped_count = len(docker_entries) - running_count
 
+        self.logger.info(
+            "Successfully listed %d containers (%d running, %d stopped)",
+            len(containers),
+            running_count,
+            stopped_count,
+        )
+        return ContainerListResponse(
+            success=True,
+            containers=containers,
+            total_count=len(containers),
+            running_count=running_count,
+            stopped_count=stopped_count,
+            compose_projects=list(compose_projects),
+            unique_images=list(unique_images),
+            total_size=(
+                self._format_size(total_size_bytes) if total_size_bytes else None
+            ),
+        )
+
+    def _parse_ps_entries(self, rows: List[str]) -> List[DockerPsEntry]:
+        """Validate docker ps JSON rows, dropping rows that are not containers"""
         try:
-            # Get container name (first name if multiple)
-            container_names = names.split(",")
-            details["name"] = container_names[0].strip()
-
-            # Check if this is a compose container
-            if len(container_names) > 1:
-                # Look for compose project and service names
-                for name in container_names:
-                    name = name.strip()
-                    if "_" in name and name.count("_") >= 2:
-                        # Typical compose naming: project_service_number
-                        parts = name.split("_")
-                        if len(parts) >= 2:
-                            details["compose_project"] = parts[0]
-                            details["compose_service"] = parts[1]
-                            break
-
-            # Get additional details using docker inspect
-            inspect_command = f"docker inspect {container_id}"
-            inspect_cmd = AsyncCommand.cmd(inspect_command)
-            inspect_result = await inspect_cmd.execute()
-
-            if inspect_result.success:
-                # Extract image tag
-                image_tag_cmd = (
-                    f"docker inspect --format='{{{{.Config.Image}}}}' {container_id}"
-                )
-                image_cmd = AsyncCommand.cmd(image_tag_cmd)
-                image_result = await image_cmd.execute()
-                if image_result.success:
-                    details["image_tag"] = image_result.stdout.strip()
-
-                # Extract health status
-                health_cmd = f"docker inspect --format='{{{{.State.Health.Status}}}}' {container_id}"
-                health_async_cmd = AsyncCommand.cmd(health_cmd)
-                health_result = await health_async_cmd.execute()
-                if health_result.success and health_result.stdout.strip():
-                    details["health_status"] = health_result.stdout.strip()
-
-                # Extract size information
-                size_cmd = f"docker inspect --format='{{{{.Size}}}}' {container_id}"
-                size_async_cmd = AsyncCommand.cmd(size_cmd)
-                size_result = await size_async_cmd.execute()
-                if size_result.success:
-                    try:
-                        size_bytes = int(size_result.stdout.strip())
-                        details["size"] = self._format_size(size_bytes)
-                    except ValueError:
-                        details["size"] = size_result.stdout.strip()
-
-                # Extract mount information
-                mounts_cmd = f"docker inspect --format='{{{{range .Mounts}}{{.Source}}:{{.Destination}} {{end}}}}' {container_id}"
-                mounts_async_cmd = AsyncCommand.cmd(mounts_cmd)
-                mounts_result = await mounts_async_cmd.execute()
-                if mounts_result.success and mounts_result.stdout.strip():
-                    details["mounts"] = mounts_result.stdout.strip().split()
-
-                # Extract network information
-                networks_cmd = f"docker inspect --format='{{{{range $key, $value := .NetworkSettings.Networks}}{{$key}} {{end}}}}' {container_id}"
-                networks_async_cmd = AsyncCommand.cmd(networks_cmd)
-                networks_result = await networks_async_cmd.execute()
-                if networks_result.success and networks_result.stdout.strip():
-                    details["networks"] = networks_result.stdout.strip().split()
+            return _PS_ENTRIES_ADAPTER.validate_json("[" + ",".join(rows) + "]")
+        except ValidationError:
+            # Only revalidate row by row when the batch holds an invalid row
+            entries = []
+            for row in rows:
+                try:
+                    entries.append(DockerPsEntry.model_validate_json(row))
+                except ValidationError:
+                    continue
+            return entries
 
-        except Exception as e:
-            # If we can't get details, just continue with basic info
-            pass
+    async def _inspect_containers(self, container_ids: List[str]) -> Dict[str, dict]:
+        """Inspect several containers with one docker call, keyed by short ID"""
+        if not container_ids:
+            return {}
+
+        # SizeRw is only reported when docker is asked to compute sizes
+        command = ["docker", "inspect", "--size", *container_ids]
+        result = await self._run_command(command)
+
+        # docker inspect still prints the containers it found when some are gone
+        if not result.stdout.strip():
+            self.logger.warning("Failed to inspect containers: %s", result.stderr)
+            return {}
+
+        try:
+            inspected = _json_loads(result.stdout)
+        except json.JSONDecodeError as e:
+            self.logger.warning("Failed to parse docker inspect output: %s", str(e))
+            return {}
+
+        return {
+            container_data.get("Id", "")[:12]: container_data
+            for container_data in inspected
+        }
+
+    def _extract_container_details(
+        self, names: str, container_data: Optional[dict]
+    ) -> dict:
+        """Extract additional container details from docker inspect data"""
+        details = {}
+
+        # Get container name (first name if multiple)
+        details["name"] = names.split(",", 1)[0].strip()
+
+        if not container_data:
+            return details
+
+        # Extract image tag
+        details["image_tag"] = (container_data.get("Config") or {}).get("Image", "")
+
+        # Extract health status
+        health = (container_data.get("State") or {}).get("Health") or {}
+        if health.get("Status"):
+            details["health_status"] = health["Status"]
+
+        # Extract size information (only present when docker computed it)
+        if container_data.get("SizeRw") is not None:
+            details["size_bytes"] = container_data["SizeRw"]
+
+        # Extract mount information
+        mounts = [
+            f"{mount.get('Source', '')}:{mount.get('Destination', '')}"
+            for mount in container_data.get("Mounts") or []
+        ]
+        if mounts:
+            details["mounts"] = mounts
+
+        # Extract network information
+        networks = list(
+            ((container_data.get("NetworkSettings") or {}).get("Networks") or {}).keys()
+        )
+        if networks:
+            details["networks"] = networks
 
         return details
 
     def _parse_compose_labels(self, labels_str: str) -> dict:
         """Parse docker-compose labels to extract project and service information"""
-        compose_info = {}
-
-        if not labels_str:
-            return compose_info
-
-        # Split labels by comma and parse each one
-        labels = labels_str.split(",")
-        for label in labels:
-            label = label.strip()
-            if label.startswith("com.docker.compose."):
-                # Extract compose information
-                if "project=" in label:
-                    compose_info["project"] = label.split("=")[1]
-                elif "service=" in label:
-                    compose_info["service"] = label.split("=")[1]
-                elif "config-hash=" in label:
-                    compose_info["config_hash"] = label.split("=")[1]
-                elif "container-number=" in label:
-                    compose_info["container_number"] = label.split("=")[1]
-                elif "depends_on=" in label:
-                    compose_info["depends_on"] = label.split("=")[1]
-                elif "version=" in label:
-                    compose_info["version"] = label.split("=")[1]
-                elif "config_files=" in label:
-                    compose_info["config_files"] = label.split("=")[1]
-                elif "working_dir=" in label:
-                    compose_info["working_dir"] = label.split("=")[1]
-
-        return compose_info
+        return self._parse_compose_labels_from_dict(self._parse_labels(labels_str))
 
     def _parse_ports(self, ports_str: str) -> list:
         """Parse ports string into structured format"""
@@ -690,23 +903,24 @@ class DockerService(BaseService):
 
         return labels
 
-    def _format_size(self, size_bytes: int) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _format_size(size_bytes: int) -> str:
         """Format size in bytes to human readable format"""
-        for unit in ["B", "KB", "MB", "GB"]:
-            if size_bytes < 1024.0:
-                return f"{size_bytes:.1f} {unit}"
-            size_bytes /= 1024.0
-        return f"{size_bytes:.1f} TB"
+        # Every unit is 2**10 times the previous one, so the bit length picks it
+        unit_index = min(
+            len(_SIZE_UNITS) - 1, (max(size_bytes, 1).bit_length() - 1) // 10
+        )
+        return f"{size_bytes / (1 << (10 * unit_index)):.1f} {_SIZE_UNITS[unit_index]}"
 
     async def stop_container(self, container_name: str) -> ContainerOperationResponse:
         """Stop a running Docker container by name."""
         self.logger.info("Stopping container: %s", container_name)
 
         try:
-            command = f"docker stop {container_name}"
-            self.logger.debug("Executing command: %s", command)
-            async_cmd = AsyncCommand.cmd(command)
-            result = await async_cmd.execute()
+            command = ["docker", "stop", container_name]
+            result = await self._run_command(command)
+            self._invalidate_container(container_name)
 
             if result.success:
                 self.logger.info("Successfully stopped container: %s", container_name)
@@ -717,7 +931,6 @@ class DockerService(BaseService):
                     previous_status=ContainerStatus.RUNNING,
                     current_status=ContainerStatus.STOPPED,
                     message=f"Container {container_name} stopped successfully",
-                    error=None,
                 )
             else:
                 self.logger.error(
@@ -745,10 +958,9 @@ class DockerService(BaseService):
         self.logger.info("Starting container: %s", container_name)
 
         try:
-            command = f"docker start {container_name}"
-            self.logger.debug("Executing command: %s", command)
-            async_cmd = AsyncCommand.cmd(command)
-            result = await async_cmd.execute()
+            command = ["docker", "start", container_name]
+            result = await self._run_command(command)
+            self._invalidate_container(container_name)
 
             if result.success:
                 self.logger.info("Successfully started container: %s", container_name)
@@ -759,7 +971,6 @@ class DockerService(BaseService):
                     previous_status=ContainerStatus.STOPPED,
                     current_status=ContainerStatus.RUNNING,
                     message=f"Container {container_name} started successfully",
-                    error=None,
                 )
             else:
                 self.logger.error(
@@ -787,9 +998,8 @@ class DockerService(BaseService):
     ) -> ContainerOperationResponse:
         """Restart a Docker container by name."""
         try:
-            command = f"docker restart {container_name}"
-            async_cmd = AsyncCommand.cmd(command)
-            result = await async_cmd.execute()
+            result = await self._run_command(["docker", "restart", container_name])
+            self._invalidate_container(container_name)
 
             if result.success:
                 return ContainerOperationResponse(
@@ -799,7 +1009,6 @@ class DockerService(BaseService):
                     previous_status=ContainerStatus.RUNNING,
                     current_status=ContainerStatus.RUNNING,
                     message=f"Container {container_name} restarted successfully",
-                    error=None,
                 )
             else:
                 return ContainerOperationResponse(
@@ -823,38 +1032,27 @@ class DockerService(BaseService):
     ) -> ContainerHealthResponse:
         """Check the health status of a Docker container."""
         try:
-            # First check if container exists and get its status
-            inspect_command = f"docker inspect --format='{{{{.State.Health.Status}}}}' {container_name}"
-            async_cmd = AsyncCommand.cmd(inspect_command)
-            result = await async_cmd.execute()
+            # Read the container state and its health in the same inspect
+            result = await self._run_command(
+                [
+                    "docker",
+                    "inspect",
+                    "--format",
+                    "{{.State.Status}}|{{if .State.Health}}"
+                    "{{.State.Health.Status}}{{end}}",
+                    container_name,
+                ]
+            )
 
             if result.success:
-                health_status_str = result.stdout.strip()
-                if health_status_str:
-                    # Map the health status to our enum
-                    if health_status_str == "healthy":
-                        health_status = HealthStatus.HEALTHY
-                    elif health_status_str == "unhealthy":
-                        health_status = HealthStatus.UNHEALTHY
-                    elif health_status_str == "starting":
-                        health_status = HealthStatus.STARTING
-                    else:
-                        health_status = HealthStatus.NONE
-
-                    return ContainerHealthResponse(
-                        success=True,
-                        container_name=container_name,
-                        health_status=health_status,
-                        error=None,
-                    )
-                else:
-                    # Container exists but no health check configured
-                    return ContainerHealthResponse(
-                        success=True,
-                        container_name=container_name,
-                        health_status=HealthStatus.NONE,
-                        error=None,
-                    )
+                status, _, health = result.stdout.strip().partition("|")
+                # An empty health means the container has no health check configured
+                return ContainerHealthResponse(
+                    success=True,
+                    container_name=container_name,
+                    health_status=health or HealthStatus.NONE,
+                    status=self._parse_status(status),
+                )
             else:
                 return ContainerHealthResponse(
                     success=False,
@@ -875,21 +1073,21 @@ class DockerService(BaseService):
     ) -> ContainerLogsResponse:
         """Get recent logs from a Docker container."""
         try:
-            command = f"docker logs --tail {tail_lines} {container_name}"
-            async_cmd = AsyncCommand.cmd(command)
-            result = await async_cmd.execute()
+            async_cmd = AsyncCommand(
+                ["docker", "logs", "--tail", str(tail_lines), container_name]
+            )
+            # Collect lines straight off the pipe instead of splitting one big buffer
+            async with self._command_slots:
+                logs = [line async for line in async_cmd.stream_lines()]
+            result = async_cmd.result
 
             if result.success:
-                logs = (
-                    result.stdout.strip().split("\n") if result.stdout.strip() else []
-                )
                 return ContainerLogsResponse(
                     success=True,
                     container_name=container_name,
                     logs=logs,
                     total_lines=len(logs),
                     tail_lines=tail_lines,
-                    error=None,
                 )
             else:
                 return ContainerLogsResponse(
@@ -908,10 +1106,12 @@ class DockerService(BaseService):
     ) -> ContainerRemoveResponse:
         """Remove a Docker container by name."""
         try:
-            flag = "-f" if force else ""
-            command = f"docker rm {flag} {container_name}".strip()
-            async_cmd = AsyncCommand.cmd(command)
-            result = await async_cmd.execute()
+            command = ["docker", "rm"]
+            if force:
+                command.append("-f")
+            command.append(container_name)
+            result = await self._run_command(command)
+            self._invalidate_container(container_name)
 
             if result.success:
                 return ContainerRemoveResponse(
@@ -920,7 +1120,6 @@ class DockerService(BaseService):
                     removed=True,
                     force_used=force,
                     message=f"Container {container_name} removed successfully",
-                    error=None,
                 )
             else:
                 return ContainerRemoveResponse(
@@ -970,17 +1169,7 @@ class DockerService(BaseService):
                     error="Missing image information",
                 )
 
-            # Stop and remove the old container
-            stop_result = await self.stop_container(request.container_name)
-            if not stop_result.success:
-                return ContainerRedeployResponse(
-                    success=False,
-                    container_name=request.container_name,
-                    deploy_command="",
-                    message=f"Failed to stop container: {stop_result.error}",
-                    error=stop_result.error,
-                )
-
+            # Remove the old container; forcing it stops it in the same docker call
             remove_result = await self.remove_container(
                 request.container_name, force=True
             )
@@ -994,11 +1183,12 @@ class DockerService(BaseService):
                 )
 
             # Build the new deploy command
-            deploy_command = self._build_redeploy_command(request, new_image)
+            deploy_args = self._build_redeploy_args(request, new_image)
+            deploy_command = shlex.join(deploy_args)
 
             # Run the new container
-            run_async_cmd = AsyncCommand.cmd(deploy_command)
-            run_result = await run_async_cmd.execute()
+            run_result = await self._run_command(deploy_args)
+            self._invalidate_container(request.container_name)
             if not run_result.success:
                 return ContainerRedeployResponse(
                     success=False,
@@ -1011,14 +1201,16 @@ class DockerService(BaseService):
                     error=run_result.stderr,
                 )
 
-            # Get the new container ID
-            new_id_async_cmd = AsyncCommand.cmd(
-                f"docker inspect --format='{{{{.Id}}}}' {request.container_name}"
-            )
-            new_id_result = await new_id_async_cmd.execute()
-            new_container_id = (
-                new_id_result.stdout.strip() if new_id_result.success else None
-            )
+            # docker run -d prints the new container ID, no inspect needed
+            run_output = run_result.stdout.strip().splitlines()
+            new_container_id = run_output[-1] if run_output else None
+            if not new_container_id or len(new_container_id) < 12:
+                new_id_result = await self._run_command(
+                    ["docker", "inspect", "--format", "{{.Id}}", request.container_name]
+                )
+                new_container_id = (
+                    new_id_result.stdout.strip() if new_id_result.success else None
+                )
 
             return ContainerRedeployResponse(
                 success=True,
@@ -1029,7 +1221,6 @@ class DockerService(BaseService):
                 new_image=new_image,
                 deploy_command=deploy_command,
                 message=f"Container {request.container_name} redeployed successfully",
-                error=None,
             )
 
         except Exception as e:
@@ -1043,60 +1234,36 @@ class DockerService(BaseService):
 
     def _build_redeploy_command(self, request: RedeployRequest, image: str) -> str:
         """Build the docker run command for redeployment"""
+        return shlex.join(self._build_redeploy_args(request, image))
+
+    def _build_redeploy_args(self, request: RedeployRequest, image: str) -> List[str]:
+        """Build the docker run argv for redeployment"""
         cmd_parts = ["docker", "run", "-d"]  # -d for detached mode
 
         # Container name
         cmd_parts.extend(["--name", request.container_name])
 
         # Environment variables
-        if request.environment_vars:
-            for key, value in request.environment_vars.items():
-                cmd_parts.extend(["-e", f"{key}={value}"])
+        for key, value in (request.environment_vars or {}).items():
+            cmd_parts.extend(["-e", f"{key}={value}"])
 
         # Port mappings
-        if request.ports:
-            for host_port, container_port in request.ports.items():
-                cmd_parts.extend(["-p", f"{host_port}:{container_port}"])
+        for host_port, container_port in (request.ports or {}).items():
+            cmd_parts.extend(["-p", f"{host_port}:{container_port}"])
 
         # Volume mounts
-        if request.volumes:
-            for volume in request.volumes:
-                cmd_parts.extend(["-v", volume])
+        for volume in request.volumes or ():
+            cmd_parts.extend(["-v", volume])
 
         # Image
         cmd_parts.append(image)
 
-        return " ".join(cmd_parts)
-
-    async def execute_multiple_commands(self, commands: list[str]) -> list:
-        """Execute multiple Docker commands concurrently for better performance."""
-        # Create AsyncCommand instances for all commands
-        async_commands = [AsyncCommand.cmd(cmd) for cmd in commands]
-
-        # Execute all commands concurrently
-        tasks = [cmd.execute() for cmd in async_commands]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        # Convert results to a simple format
-        responses = []
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                responses.append({"success": False, "output": "", "error": str(result)})
-            else:
-                responses.append(
-                    {
-                        "success": result.success,
-                        "output": result.stdout,
-                        "error": result.stderr if not result.success else None,
-                    }
-                )
-
-        return responses
+        return cmd_parts
 
     async def batch_container_operations(
         self, container_names: list[str], operation: str
     ) -> list[ContainerOperationResponse]:
-        """Execute the same operation on multiple containers concurrently."""
+        """Execute the same operation on multiple containers with one docker call."""
         self.logger.info(
             "Starting batch %s operation on %d containers: %s",
             operation,
@@ -1104,77 +1271,14 @@ class DockerService(BaseService):
             container_names,
         )
 
-        if operation == "stop":
-            commands = [f"docker stop {name}" for name in container_names]
-        elif operation == "start":
-            commands = [f"docker start {name}" for name in container_names]
-        elif operation == "restart":
-            commands = [f"docker restart {name}" for name in container_names]
-        else:
-            self.logger.error("Unsupported batch operation: %s", operation)
-            raise ValueError(f"Unsupported operation: {operation}")
-
-        self.logger.debug("Executing %d commands concurrently", len(commands))
-        results = await self.execute_multiple_commands(commands)
-
-        responses = []
-        for i, result in enumerate(results):
-            if operation == "stop":
-                responses.append(
-                    ContainerOperationResponse(
-                        success=result.success,
-                        container_name=container_names[i],
-                        operation=operation,
-                        previous_status=ContainerStatus.RUNNING,
-                        current_status=(
-                            ContainerStatus.STOPPED if result.success else None
-                        ),
-                        message=(
-                            f"Container {container_names[i]} {operation}ed successfully"
-                            if result.success
-                            else f"Failed to {operation} container {container_names[i]}"
-                        ),
-                        error=result.error,
-                    )
-                )
-            elif operation == "start":
-                responses.append(
-                    ContainerOperationResponse(
-                        success=result.success,
-                        container_name=container_names[i],
-                        operation=operation,
-                        previous_status=ContainerStatus.STOPPED,
-                        current_status=(
-                            ContainerStatus.RUNNING if result.success else None
-                        ),
-                        message=(
-                            f"Container {container_names[i]} {operation}ed successfully"
-                            if result.success
-                            else f"Failed to {operation} container {container_names[i]}"
-                        ),
-                        error=result.error,
-                    )
-                )
-            elif operation == "restart":
-                responses.append(
-                    ContainerOperationResponse(
-                        success=result.success,
-                        container_name=container_names[i],
-                        operation=operation,
-                        previous_status=ContainerStatus.RUNNING,
-                        current_status=(
-                            ContainerStatus.RUNNING if result.success else None
-                        ),
-                        message=(
-                            f"Container {container_names[i]} {operation}ed successfully"
-                            if result.success
-                            else f"Failed to {operation} container {container_names[i]}"
-                        ),
-                        error=result.error,
-                    )
-                )
+        responses = {
+            response.container_name: response
+            async for response in self.stream_batch_container_operations(
+                container_names, operation
+            )
+        }
 
-        success_count = sum(1 for r in responses if r.success)
+        success_count = sum(1 for r in responses.values() if r.success)
         failure_count = len(responses) - success_count
         self.logger.info(
             "Batch %s operation completed: %d successful, %d failed",
@@ -1183,7 +1287,73 @@ class DockerService(BaseService):
             failure_count,
         )
 
-        return responses
+        return [responses[name] for name in container_names]
+
+    async def stream_batch_container_operations(
+        self, container_names: list[str], operation: str
+    ) -> AsyncIterator[ContainerOperationResponse]:
+        """Yield each container's result as soon as the docker call reports it."""
+        if operation not in _BATCH_OPERATION_STATUSES:
+            self.logger.error("Unsupported batch operation: %s", operation)
+            raise ValueError(f"Unsupported operation: {operation}")
+
+        # docker handles every container itself and echoes each one once it is done
+        pending = dict.fromkeys(container_names)
+        async_cmd = AsyncCommand(["docker", operation, *pending])
+        lines: asyncio.Queue = asyncio.Queue()
+
+        async def pump_lines() -> None:
+            # Only this task holds the process slot, so a slow consumer of the
+            # stream does not keep it busy; None marks the end of the output
+            try:
+                async with self._command_slots:
+                    async for line in async_cmd.stream_lines():
+                        lines.put_nowait(line)
+            finally:
+                lines.put_nowait(None)
+
+        pump = asyncio.create_task(pump_lines())
+        try:
+            while (line := await lines.get()) is not None:
+                name = line.strip()
+                if name in pending:
+                    del pending[name]
+                    self._invalidate_container(name)
+                    yield self._batch_operation_response(name, operation)
+            await pump
+        finally:
+            pump.cancel()
+
+        # Whatever docker did not echo failed; its stderr names the culprit
+        stderr = async_cmd.result.stderr
+        error_lines = stderr.splitlines()
+        for name in pending:
+            self._invalidate_container(name)
+            yield self._batch_operation_response(
+                name,
+                operation,
+                error=next((line for line in error_lines if name in line), stderr),
+            )
+
+    def _batch_operation_response(
+        self, container_name: str, operation: str, error: Optional[str] = None
+    ) -> ContainerOperationResponse:
+        """Build the response for one container of a batch operation"""
+        previous_status, current_status = _BATCH_OPERATION_STATUSES[operation]
+        success = error is None
+        return ContainerOperationResponse(
+            success=success,
+            container_name=container_name,
+            operation=operation,
+            previous_status=previous_status,
+            current_status=current_status if success else None,
+            message=(
+                f"Container {container_name} {operation}ed successfully"
+                if success
+                else f"Failed to {operation} container {container_name}"
+            ),
+            error=error,
+        )
 
 
 __all__ = ["DockerService"]
@@ -1,4 +1,9 @@
-from typing import Any, Optional
+import asyncio
+import functools
+import logging
+import time
+from types import MappingProxyType
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
 
 from danielutils.abstractions.db import (
     Condition,
@@ -20,22 +25,136 @@ from ...schemas.v1.settings import (
 from ...utils.logger import get_logger
 from .base_service import BaseService
 
+# Upper bound on database writes a bulk update keeps in flight at once
+_MAX_CONCURRENT_UPDATES = 8
+
+# Seconds a setting read from the database is served from memory
+_SETTINGS_CACHE_TTL = 5.0
+
+# The settings table stores booleans as lowercase strings
+_BOOL_STR = {True: "true", False: "false"}
+
+# Reads of the whole table reuse one query object
+_ALL_SETTINGS_QUERY = SelectQuery(table="settings")
+
+
+def _where_id(setting_id: str) -> WhereClause:
+    """Build the clause that selects a single setting by ID."""
+    return WhereClause(
+        conditions=[Condition(column="id", operator=Operator.EQ, value=setting_id)]
+    )
+
+
+def _select_ids(setting_ids: List[str]) -> SelectQuery:
+    """Build the query that reads several settings by ID."""
+    return SelectQuery(
+        table="settings",
+        where=WhereClause(
+            conditions=[
+                Condition(
+                    column="id", operator=Operator.IN, value=list(set(setting_ids))
+                )
+            ]
+        ),
+    )
+
+
+class _SettingMeta(NamedTuple):
+    """Fixed metadata of a setting written by a convenience method."""
+
+    category: str
+    setting_type: str
+    description: str
+    is_user_editable: bool = True
+
+
+# Metadata of the settings the convenience methods write, keyed by setting ID
+_SETTING_META = MappingProxyType(
+    {
+        "speed_test_enabled": _SettingMeta(
+            "widgets", "enabled", "Enable or disable internet speed test widget"
+        ),
+        "search_engine_preference": _SettingMeta(
+            "search_engine", "engine_preference", "User's preferred search engine"
+        ),
+    }
+)
+
+# Chrome profile settings are keyed per profile, so their description is a template
+_CHROME_PROFILE_META = _SettingMeta(
+    "chrome_profiles",
+    "profile_display",
+    "Display settings for Chrome profile {profile_id}",
+)
+
 
 class SettingsService(BaseService):
     """Service for managing application settings."""
 
     def __init__(self):
         self.db = get_db()
+        self._update_slots = asyncio.Semaphore(_MAX_CONCURRENT_UPDATES)
+        self._setting_cache: Dict[str, Tuple[float, SettingValue]] = {}
+        self._all_settings_cache: Optional[Tuple[float, List[SettingValue]]] = None
+        self._cache_generation = 0
+        self._inflight_reads: Dict[str, asyncio.Future] = {}
+
+    @staticmethod
+    def _is_fresh(entry: Optional[Tuple[float, Any]]) -> bool:
+        """Whether a cached (timestamp, value) entry is still within the TTL."""
+        return entry is not None and time.monotonic() - entry[0] < _SETTINGS_CACHE_TTL
+
+    def _invalidate_settings(self, *setting_ids: str) -> None:
+        """Drop cached reads of settings that were just written."""
+        # Reads that started before this write must not cache what they fetched
+        self._cache_generation += 1
+        for setting_id in setting_ids:
+            self._setting_cache.pop(setting_id, None)
+            # Later lookups must not join a query that may predate the write
+            self._inflight_reads.pop(setting_id, None)
+        self._all_settings_cache = None
+
+    def _log_write(
+        self, operation: str, setting_id: str, affected_rows: int, start: float
+    ) -> None:
+        """Log the outcome of a single setting write as one structured record."""
+        self.logger.log(
+            logging.INFO if affected_rows > 0 else logging.WARNING,
+            "Setting %s %s",
+            operation,
+            "applied" if affected_rows > 0 else "matched no rows",
+            extra={
+                "data": {
+                    "id": setting_id,
+                    "affected_rows": affected_rows,
+                    "duration_ms": round((time.perf_counter() - start) * 1000, 2),
+                }
+            },
+        )
 
     async def get_all_settings(self) -> SettingsResponse:
         """Get all settings from the database in a generic format."""
         self.logger.info("Starting to retrieve all settings from database")
+        cached = self._all_settings_cache
+        if self._is_fresh(cached):
+            self.logger.debug("Serving cached settings")
+            settings = list(cached[1])
+            return SettingsResponse(
+                success=True,
+                message=f"Retrieved {len(settings)} settings",
+                settings=settings,
+            )
+
         try:
-            query = SelectQuery(table="settings")
             self.logger.debug("Executing database query to fetch all settings")
-            records = await self.db.get(query)
+            generation = self._cache_generation
+            records = await self.db.get(_ALL_SETTINGS_QUERY)
 
             settings = [SettingValue(**record) for record in records]
+            if generation == self._cache_generation:
+                now = time.monotonic()
+                self._all_settings_cache = (now, list(settings))
+                self._setting_cache.update((s.id, (now, s)) for s in settings)
             self.logger.info(
                 "Successfully retrieved %d settings from database", len(settings)
             )
@@ -55,22 +174,45 @@ class SettingsService(BaseService):
 
     async def get_setting(self, setting_id: str) -> Optional[SettingValue]:
         """Get a specific setting by ID."""
-        self.logger.info("Starting to retrieve setting with ID: %s", setting_id)
-        try:
-            where_clause = WhereClause(
-                conditions=[
-                    Condition(column="id", operator=Operator.EQ, value=setting_id)
-                ]
+        self.logger.debug("Starting to retrieve setting with ID: %s", setting_id)
+        cached = self._setting_cache.get(setting_id)
+        if self._is_fresh(cached):
+            self.logger.debug("Serving cached setting: %s", setting_id)
+            return cached[1]
+
+        # Concurrent lookups for the same ID share one database query
+        inflight = self._inflight_reads.get(setting_id)
+        if inflight is None:
+            inflight = asyncio.ensure_future(self._fetch_setting(setting_id))
+            self._inflight_reads[setting_id] = inflight
+            inflight.add_done_callback(
+                functools.partial(self._forget_inflight_read, setting_id)
             )
+        # Shielded so one cancelled caller does not cancel the query for the rest
+        return await asyncio.shield(inflight)
+
+    def _forget_inflight_read(self, setting_id: str, future: asyncio.Future) -> None:
+        """Stop sharing a finished lookup, unless a newer one replaced it."""
+        if self._inflight_reads.get(setting_id) is future:
+            del self._inflight_reads[setting_id]
+
+    async def _fetch_setting(self, setting_id: str) -> Optional[SettingValue]:
+        """Get a specific setting straight from the database."""
+        try:
+            where_clause = _where_id(setting_id)
             query = SelectQuery(table="settings", where=where_clause)
             self.logger.debug(
                 "Executing database query to fetch setting: %s", setting_id
             )
+            generation = self._cache_generation
             records = await self.db.get(query)
 
             if records:
                 self.logger.info("Successfully retrieved setting: %s", setting_id)
-                return SettingValue(**records[0])
+                setting = SettingValue(**records[0])
+                if generation == self._cache_generation:
+                    self._setting_cache[setting_id] = (time.monotonic(), setting)
+                return setting
             else:
                 self.logger.warning("Setting not found: %s", setting_id)
                 return None
@@ -79,47 +221,37 @@ class SettingsService(BaseService):
             return None
 
     async def update_setting(
-        self, request: SettingUpdateRequest
+        self, request: SettingUpdateRequest, return_setting: bool = True
     ) -> SettingUpdateResponse:
-        """Update a specific setting."""
-        self.logger.info(
-            "Starting to update setting: %s with value: %s", request.id, request.value
-        )
+        """Update a specific setting, re-reading it only if return_setting is set."""
+        start = time.perf_counter()
         try:
-            # Check if setting exists
-            self.logger.debug("Checking if setting exists: %s", request.id)
-            existing = await self.get_setting(request.id)
-            if not existing:
-                self.logger.warning("Setting not found for update: %s", request.id)
-                return SettingUpdateResponse(
-                    success=False, message=f"Setting '{request.id}' not found"
-                )
-
-            # Update the setting
-            where_clause = WhereClause(
-                conditions=[
-                    Condition(column="id", operator=Operator.EQ, value=request.id)
-                ]
-            )
+            # No rows affected means the setting does not exist, so skip a lookup
+            where_clause = _where_id(request.id)
             query = UpdateQuery(
                 table="settings", where=where_clause, data={"value": request.value}
             )
-            self.logger.debug("Executing database update for setting: %s", request.id)
+            cached = self._setting_cache.get(request.id)
             affected_rows = await self.db.update(query)
+            self._invalidate_settings(request.id)
+            self._log_write("update", request.id, affected_rows, start)
 
             if affected_rows > 0:
-                self.logger.info("Successfully updated setting: %s", request.id)
-                # Get the updated setting
-                updated_setting = await self.get_setting(request.id)
+                # Only the value changed, so a cached row can answer without a read
+                if not return_setting:
+                    updated_setting = None
+                elif self._is_fresh(cached):
+                    updated_setting = cached[1].model_copy(
+                        update={"value": request.value}
+                    )
+                else:
+                    updated_setting = await self.get_setting(request.id)
                 return SettingUpdateResponse(
                     success=True,
                     message=f"Setting '{request.id}' updated successfully",
                     setting=updated_setting,
                 )
             else:
-                self.logger.warning(
-                    "No rows affected when updating setting: %s", request.id
-                )
                 return SettingUpdateResponse(
                     success=False, message=f"Setting '{request.id}' not found"
                 )
@@ -138,62 +270,47 @@ class SettingsService(BaseService):
         value: Any,
         description: Optional[str] = None,
         is_user_editable: bool = True,
+        return_setting: bool = True,
     ) -> SettingUpdateResponse:
-        """Create or update a setting."""
-        self.logger.info(
-            "Starting create_or_update_setting for ID: %s, category: %s, type: %s",
-            setting_id,
-            category,
-            setting_type,
-        )
+        """Create or update a setting, re-reading it only if return_setting is set."""
+        start = time.perf_counter()
         try:
-            # Check if setting exists
-            self.logger.debug("Checking if setting exists: %s", setting_id)
-            existing = await self.get_setting(setting_id)
-
-            if existing:
-                self.logger.info("Setting exists, updating: %s", setting_id)
-                # Update existing setting
-                where_clause = WhereClause(
-                    conditions=[
-                        Condition(column="id", operator=Operator.EQ, value=setting_id)
-                    ]
-                )
-                query = UpdateQuery(
-                    table="settings",
-                    where=where_clause,
-                    data={
-                        "value": value,
-                        "description": description,
-                        "is_user_editable": str(is_user_editable).lower(),
-                    },
-                )
-                self.logger.debug(
-                    "Executing database update for existing setting: %s", setting_id
-                )
-                affected_rows = await self.db.update(query)
+            # Try the update first; no rows affected means the setting is new
+            where_clause = _where_id(setting_id)
+            query = UpdateQuery(
+                table="settings",
+                where=where_clause,
+                data={
+                    "value": value,
+                    "description": description,
+                    "is_user_editable": _BOOL_STR[is_user_editable],
+                },
+            )
+            cached = self._setting_cache.get(setting_id)
+            affected_rows = await self.db.update(query)
+            self._invalidate_settings(setting_id)
 
-                if affected_rows > 0:
-                    self.logger.info(
-                        "Successfully updated existing setting: %s", setting_id
-                    )
-                    updated_setting = await self.get_setting(setting_id)
-                    return SettingUpdateResponse(
-                        success=True,
-                        message=f"Setting '{setting_id}' updated successfully",
-                        setting=updated_setting,
+            if affected_rows > 0:
+                self._log_write("update", setting_id, affected_rows, start)
+                # A cached row plus the written fields answers without a read
+                if not return_setting:
+                    updated_setting = None
+                elif self._is_fresh(cached):
+                    updated_setting = cached[1].model_copy(
+                        update={
+                            "value": value,
+                            "description": description,
+                            "is_user_editable": is_user_editable,
+                        }
                     )
                 else:
-                    self.logger.warning(
-                        "No rows affected when updating existing setting: %s",
-                        setting_id,
-                    )
-                    return SettingUpdateResponse(
-                        success=False,
-                        message=f"Failed to update setting '{setting_id}'",
-                    )
+                    updated_setting = await self.get_setting(setting_id)
+                return SettingUpdateResponse(
+                    success=True,
+                    message=f"Setting '{setting_id}' updated successfully",
+                    setting=updated_setting,
+                )
             else:
-                self.logger.info("Setting does not exist, creating new: %s", setting_id)
                 # Create new setting
                 data = {
                     "id": setting_id,
@@ -201,17 +318,17 @@ class SettingsService(BaseService):
                     "setting_type": setting_type,
                     "value": value,
                     "description": description,
-                    "is_user_editable": str(is_user_editable).lower(),
+                    "is_user_editable": _BOOL_STR[is_user_editable],
                 }
 
-                self.logger.debug(
-                    "Executing database insert for new setting: %s", setting_id
-                )
                 await self.db.insert("settings", data)
+                self._invalidate_settings(setting_id)
+                self._log_write("create", setting_id, 1, start)
 
                 # Get the created setting
-                created_setting = await self.get_setting(setting_id)
-                self.logger.info("Successfully created new setting: %s", setting_id)
+                created_setting = (
+                    await self.get_setting(setting_id) if return_setting else None
+                )
                 return SettingUpdateResponse(
                     success=True,
                     message=f"Setting '{setting_id}' created successfully",
@@ -230,79 +347,61 @@ class SettingsService(BaseService):
         self, request: BulkSettingsUpdateRequest
     ) -> BulkSettingsUpdateResponse:
         """Update multiple settings at once."""
-        self.logger.info("Starting bulk update for %d settings", len(request.settings))
+        start = time.perf_counter()
         updated_settings = []
         failed_updates = []
 
         try:
-            for i, setting_request in enumerate(request.settings):
-                self.logger.debug(
-                    "Processing setting %d/%d: %s",
-                    i + 1,
-                    len(request.settings),
-                    setting_request.id,
-                )
-                try:
-                    # Check if setting exists
-                    existing = await self.get_setting(setting_request.id)
-
-                    if existing:
-                        # Update the setting
-                        where_clause = WhereClause(
-                            conditions=[
-                                Condition(
-                                    column="id",
-                                    operator=Operator.EQ,
-                                    value=setting_request.id,
-                                )
-                            ]
-                        )
-                        query = UpdateQuery(
-                            table="settings",
-                            where=where_clause,
-                            data={"value": setting_request.value},
-                        )
-                        affected_rows = await self.db.update(query)
-
-                        if affected_rows > 0:
-                            updated_setting = await self.get_setting(setting_request.id)
-                            updated_settings.append(updated_setting)
-                            self.logger.debug(
-                                "Successfully updated setting in bulk: %s",
-                                setting_request.id,
-                            )
-                        else:
-                            failed_updates.append(
-                                {
-                                    "id": setting_request.id,
-                                    "error": "Failed to update setting",
-                                }
-                            )
-                            self.logger.warning(
-                                "Failed to update setting in bulk (no rows affected): %s",
-                                setting_request.id,
-                            )
-                    else:
-                        failed_updates.append(
-                            {"id": setting_request.id, "error": "Setting not found"}
-                        )
-                        self.logger.warning(
-                            "Setting not found in bulk update: %s", setting_request.id
-                        )
-                except Exception as e:
-                    failed_updates.append({"id": setting_request.id, "error": str(e)})
-                    self.logger.error(
-                        "Error updating setting in bulk %s: %s",
-                        setting_request.id,
-                        str(e),
+            # One read tells which settings exist; missing ones fail without a query
+            records = await self.db.get(_select_ids([r.id for r in request.settings]))
+            existing_ids = {record["id"] for record in records}
+
+            # Updates of different settings are independent, so run them
+            # concurrently within the bound; of repeated IDs only the last one is
+            # written, as it would have won when writing in order
+            to_update = {r.id: r for r in request.settings if r.id in existing_ids}
+            results = await asyncio.gather(
+                *(self._bulk_update_one(r) for r in to_update.values()),
+                return_exceptions=True,
+            )
+            errors = dict(zip(to_update, results))
+            self._invalidate_settings(*to_update)
+
+            updated_ids = []
+            for setting_request in request.settings:
+                if setting_request.id not in existing_ids:
+                    failed_updates.append(
+                        {"id": setting_request.id, "error": "Setting not found"}
                     )
+                    continue
+
+                error = errors[setting_request.id]
+                if error is None:
+                    updated_ids.append(setting_request.id)
+                else:
+                    failed_updates.append(
+                        {"id": setting_request.id, "error": str(error)}
+                    )
+
+            # Read every updated row back with a single query
+            if updated_ids:
+                records = await self.db.get(_select_ids(updated_ids))
+                by_id = {record["id"]: record for record in records}
+                updated_settings.extend(
+                    SettingValue(**by_id[setting_id])
+                    for setting_id in updated_ids
+                    if setting_id in by_id
+                )
 
-            success_count = len(updated_settings)
-            failure_count = len(failed_updates)
             self.logger.info(
-                "Bulk update completed: %d successful, %d failed",
-                success_count,
-                failure_count,
+                "Bulk update completed",
+                extra={
+                    "data": {
+                        "updated": len(updated_settings),
+                        "failed": [f["id"] for f in failed_updates],
+                        "duration_ms": round((time.perf_counter() - start) * 1000, 2),
+                    }
+                },
             )
 
             return BulkSettingsUpdateResponse(
@@ -320,46 +419,69 @@ class SettingsService(BaseService):
                 message=f"Error in bulk update: {str(e)}",
             )
 
+    async def _bulk_update_one(
+        self, setting_request: SettingUpdateRequest
+    ) -> Optional[str]:
+        """Update one setting of a bulk request, returning an error if it failed."""
+        async with self._update_slots:
+            try:
+                where_clause = _where_id(setting_request.id)
+                query = UpdateQuery(
+                    table="settings",
+                    where=where_clause,
+                    data={"value": setting_request.value},
+                )
+                affected_rows = await self.db.update(query)
+            except Exception as e:
+                self.logger.error(
+                    "Error updating setting in bulk %s: %s",
+                    setting_request.id,
+                    str(e),
+                )
+                return str(e)
+
+        return None if affected_rows > 0 else "Failed to update setting"
+
     # Convenience methods for specific setting types
-    async def update_speed_test_setting(self, enabled: bool) -> SettingUpdateResponse:
-        """Update speed test setting."""
-        self.logger.info("Updating speed test setting: enabled=%s", enabled)
-        value = {"enabled": enabled}
+    async def _apply_setting(
+        self, setting_id: str, meta: _SettingMeta, value: Any, **description_args
+    ) -> SettingUpdateResponse:
+        """Create or update a setting described by a metadata table entry."""
         result = await self.create_or_update_setting(
-            setting_id="speed_test_enabled",
-            category="widgets",
-            setting_type="enabled",
+            setting_id=setting_id,
+            category=meta.category,
+            setting_type=meta.setting_type,
             value=value,
-            description="Enable or disable internet speed test widget",
-            is_user_editable=True,
+            description=meta.description.format(**description_args),
+            is_user_editable=meta.is_user_editable,
+            # Callers of the convenience endpoints only read success and message
+            return_setting=False,
         )
-        if result.success:
-            self.logger.info("Successfully updated speed test setting")
-        else:
-            self.logger.error("Failed to update speed test setting: %s", result.message)
+        if not result.success:
+            self.logger.error(
+                "Failed to update setting %s: %s", setting_id, result.message
+            )
         return result
 
+    async def update_speed_test_setting(self, enabled: bool) -> SettingUpdateResponse:
+        """Update speed test setting."""
+        self.logger.info("Updating speed test setting: enabled=%s", enabled)
+        return await self._apply_setting(
+            "speed_test_enabled",
+            _SETTING_META["speed_test_enabled"],
+            {"enabled": enabled},
+        )
+
     async def update_search_engine_setting(
         self, selected_engine: str
     ) -> SettingUpdateResponse:
         """Update search engine setting."""
         self.logger.info("Updating search engine setting: %s", selected_engine)
-        value = {"selected_engine": selected_engine}
-        result = await self.create_or_update_setting(
-            setting_id="search_engine_preference",
-            category="search_engine",
-            setting_type="engine_preference",
-            value=value,
-            description="User's preferred search engine",
-            is_user_editable=True,
+        return await self._apply_setting(
+            "search_engine_preference",
+            _SETTING_META["search_engine_preference"],
+            {"selected_engine": selected_engine},
         )
-        if result.success:
-            self.logger.info("Successfully updated search engine setting")
-        else:
-            self.logger.error(
-                "Failed to update search engine setting: %s", result.message
-            )
-        return result
 
     async def update_chrome_profile_setting(
         self, profile_id: str, display_name: str, icon: str, enabled: bool
@@ -371,32 +493,18 @@ class SettingsService(BaseService):
             display_name,
             enabled,
         )
-        setting_id = f"chrome_profile_{profile_id}"
         value = {
             "profile_id": profile_id,
             "display_name": display_name,
             "icon": icon,
             "enabled": enabled,
         }
-        result = await self.create_or_update_setting(
-            setting_id=setting_id,
-            category="chrome_profiles",
-            setting_type="profile_display",
-            value=value,
-            description=f"Display settings for Chrome profile {profile_id}",
-            is_user_editable=True,
+        return await self._apply_setting(
+            f"chrome_profile_{profile_id}",
+            _CHROME_PROFILE_META,
+            value,
+            profile_id=profile_id,
         )
-        if result.success:
-            self.logger.info(
-                "Successfully updated Chrome profile setting: %s", profile_id
-            )
-        else:
-            self.logger.error(
-                "Failed to update Chrome profile setting %s: %s",
-                profile_id,
-                result.message,
-            )
-        return result
 
 
 __all__ = ["SettingsService"]
@@ -1,11 +1,24 @@
 import asyncio
+import collections
+import contextlib
+import functools
+import json
+import os
+import shutil
+import socket
+import statistics
+import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, List, Optional, Tuple
 
 import speedtest
 
 from ...schemas.v1.speedtest import (
     SpeedTestConfigResponse,
+    SpeedTestMode,
     SpeedTestRequest,
     SpeedTestResponse,
     SpeedTestResult,
@@ -13,6 +26,105 @@ from ...schemas.v1.speedtest import (
 from ...utils.logger import get_logger
 from .base_service import BaseService
 
+# Seconds a chosen speedtest server is reused before the server list is re-fetched
+_BEST_SERVER_TTL = 3600.0
+
+_DEFAULT_INTERVAL_SECONDS = 300
+
+# Continuous testing runs a full throughput test on the first of every N cycles
+# and only a latency probe on the others
+_FULL_TEST_EVERY = 20
+
+# A light check whose ping leaves the range of the recent ones brings the next
+# full test forward; the range is the mean +/- a few stdevs, but never under a
+# floor so that jitter on a very steady link does not count as drift
+_DRIFT_WINDOW = 10
+_DRIFT_MIN_SAMPLES = 5
+_DRIFT_STDEVS = 3.0
+_DRIFT_MIN_MS = 5.0
+
+# The light check times TCP connects to the server of the last full test
+_LIGHT_CHECK_PROBES = 5
+
+# The native Ookla CLI measures high bandwidths the Python module under-reports
+_SPEEDTEST_BINARY = os.environ.get("SPEEDTEST_BINARY", "speedtest")
+_OOKLA_VERSION_MARKER = "Speedtest by Ookla"
+_NATIVE_TEST_TIMEOUT = 180.0
+
+# Bufferbloat is measured with TCP connects to the test server, a few while the
+# link is idle and then continuously while download and upload run
+_BASELINE_PROBES = 3
+_LOADED_PROBE_INTERVAL = 0.1
+_PROBE_TIMEOUT = 1.0
+
+
+@functools.lru_cache(maxsize=8)
+def _find_ookla_binary(binary: str) -> Optional[str]:
+    """Resolve the Ookla CLI, ignoring the speedtest-cli script of the same name."""
+    path = shutil.which(binary)
+    if path is None:
+        return None
+    try:
+        version = subprocess.run(
+            [path, "--version"], capture_output=True, text=True, timeout=10
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return path if _OOKLA_VERSION_MARKER in version.stdout else None
+
+
+def _server_address(host: str) -> Tuple[str, int]:
+    """Split a speedtest server's "host:port" into a socket address."""
+    name, sep, port = host.rpartition(":")
+    return (name, int(port)) if sep else (host, 8080)
+
+
+def _tcp_connect_ms(address: Tuple[str, int]) -> Optional[float]:
+    """Time a TCP connect in milliseconds, or None if it failed."""
+    started = time.perf_counter()
+    try:
+        with socket.create_connection(address, timeout=_PROBE_TIMEOUT):
+            return (time.perf_counter() - started) * 1000
+    except OSError:
+        return None
+
+
+@contextlib.contextmanager
+def _sample_latency(address: Tuple[str, int]) -> Iterator[List[float]]:
+    """Collect TCP connect times in a background thread while the block runs."""
+    samples: List[float] = []
+    stop = threading.Event()
+
+    def sample() -> None:
+        while not stop.is_set():
+            latency = _tcp_connect_ms(address)
+            if latency is not None:
+                samples.append(latency)
+            stop.wait(_LOADED_PROBE_INTERVAL)
+
+    thread = threading.Thread(target=sample, name="speedtest-probe", daemon=True)
+    thread.start()
+    try:
+        yield samples
+    finally:
+        stop.set()
+        thread.join()
+
+
+@functools.lru_cache(maxsize=1024)
+def _format_speed(speed_mbps: float) -> tuple[str, str]:
+    if speed_mbps >= 1000:
+        return f"{speed_mbps / 1000:.1f}", "GB/s"
+    elif speed_mbps >= 1:
+        return f"{speed_mbps:.1f}", "MB/s"
+    else:
+        return f"{speed_mbps * 1000:.0f}", "KB/s"
+
+
+@functools.lru_cache(maxsize=1024)
+def _format_ping(ping_ms: float) -> str:
+    return f"{ping_ms:.0f} ms"
+
 
 class SpeedTestService(BaseService):
     """Service for performing internet speed tests."""
@@ -20,13 +132,29 @@ class SpeedTestService(BaseService):
     def __init__(self):
         self.logger = get_logger("SpeedTestService")
         self._current_config: Dict[str, Any] = {
-            "interval_seconds": 1,
+            "interval_seconds": _DEFAULT_INTERVAL_SECONDS,
             "auto_start": True,
             "is_running": False,
+            "server_id": None,
+            "speedtest_binary": _SPEEDTEST_BINARY,
         }
         self._speedtest_instance: Optional[speedtest.Speedtest] = None
+        self._best_server_at = 0.0
+        self._client_server_id: Optional[int] = None
+        # Address of the last full test's server, which light checks probe
+        self._probe_address: Optional[Tuple[str, int]] = None
+        # Light check pings since the last full test of the continuous loop
+        self._recent_pings: collections.deque = collections.deque(maxlen=_DRIFT_WINDOW)
+        # A dedicated worker keeps long tests off the default to_thread pool and
+        # runs them one at a time, so the cached client is never shared
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="speedtest"
+        )
         self._last_result: Optional[SpeedTestResult] = None
         self._test_task: Optional[asyncio.Task] = None
+        self._inflight_test: Optional[asyncio.Future] = None
+        # Queues of stream_speed_test consumers; None marks the end of a test
+        self._progress_streams: List[asyncio.Queue] = []
 
     async def perform_speed_test(
         self, request: Optional[SpeedTestRequest] = None
@@ -35,12 +163,15 @@ class SpeedTestService(BaseService):
         try:
             self.logger.info("Starting speed test...")
 
-            # Run the blocking speedtest operations in a separate thread
-            result = await asyncio.to_thread(self._run_speedtest_blocking)
+            parallel_directions = request is not None and request.parallel_directions
+            # Shielded so one cancelled caller does not abandon the test for the rest
+            result = await asyncio.shield(self._start_speed_test(parallel_directions))
 
-            self._last_result = result
             self.logger.info(
-                f"Speed test completed: {result.download_speed_mbps:.2f} Mbps down, {result.upload_speed_mbps:.2f} Mbps up, {result.ping_ms:.2f} ms ping"
+                "Speed test completed: %.2f Mbps down, %.2f Mbps up, %.2f ms ping",
+                result.download_speed_mbps,
+                result.upload_speed_mbps,
+                result.ping_ms,
             )
 
             return SpeedTestResponse(
@@ -48,76 +179,344 @@ class SpeedTestService(BaseService):
             )
 
         except Exception as e:
-            self.logger.error(f"Error performing speed test: {str(e)}")
+            self.logger.error("Error performing speed test: %s", str(e))
             return SpeedTestResponse(
                 success=False, message=f"Error performing speed test: {str(e)}"
             )
 
-    def _run_speedtest_blocking(self) -> SpeedTestResult:
-        """Run the blocking speedtest operations in a separate thread."""
+    async def stream_speed_test(
+        self, parallel_directions: bool = False
+    ) -> AsyncIterator[SpeedTestResult]:
+        """Run a speed test, yielding a snapshot as each phase completes."""
+        queue: asyncio.Queue = asyncio.Queue()
+        self._progress_streams.append(queue)
+        try:
+            inflight = self._start_speed_test(parallel_directions)
+            while (snapshot := await queue.get()) is not None:
+                yield snapshot
+            # Surface a failed test to the consumer instead of ending quietly
+            inflight.result()
+        finally:
+            self._progress_streams.remove(queue)
+
+    def _start_speed_test(self, parallel_directions: bool = False) -> asyncio.Future:
+        """Start a speed test in the worker thread, or return the running one."""
+        # Callers arriving while a test runs share it instead of starting another
+        inflight = self._inflight_test
+        if inflight is not None and not inflight.done():
+            self.logger.debug("Joining speed test already in progress")
+            return inflight
+
+        loop = asyncio.get_running_loop()
+        on_progress = functools.partial(
+            loop.call_soon_threadsafe, self._publish_progress
+        )
+        inflight = loop.run_in_executor(
+            self._executor,
+            self._run_speedtest_blocking,
+            on_progress,
+            parallel_directions,
+        )
+        inflight.add_done_callback(self._finish_speed_test)
+        self._inflight_test = inflight
+        return inflight
+
+    def _publish_progress(self, snapshot: SpeedTestResult) -> None:
+        """Hand a phase snapshot from the worker thread to every stream."""
+        for queue in self._progress_streams:
+            queue.put_nowait(snapshot)
+
+    def _finish_speed_test(self, future: asyncio.Future) -> None:
+        """Record the finished test and end the streams following it."""
+        if not future.cancelled() and future.exception() is None:
+            self._last_result = future.result()
+        for queue in self._progress_streams:
+            queue.put_nowait(None)
+
+    def _run_speedtest_blocking(
+        self,
+        on_progress: Optional[Callable[[SpeedTestResult], Any]] = None,
+        parallel_directions: bool = False,
+    ) -> SpeedTestResult:
+        """Run the blocking speedtest operations in the worker thread."""
         self.logger.debug("Starting blocking speedtest operations")
 
+        binary = _find_ookla_binary(self._current_config["speedtest_binary"])
+        if binary is not None:
+            result = self._run_native_speedtest(binary)
+            if result is not None:
+                if on_progress is not None:
+                    on_progress(result.model_copy())
+                return result
+
         try:
-            # Create speedtest instance
+            return self._measure(
+                self._get_speedtest_client(), on_progress, parallel_directions
+            )
+        except Exception as e:
+            # Start from a fresh client and server list next time
+            self._speedtest_instance = None
+            self.logger.error("Error in blocking speedtest operations: %s", str(e))
+            raise
+
+    def _run_native_speedtest(self, binary: str) -> Optional[SpeedTestResult]:
+        """Run the Ookla CLI, or return None to fall back to the speedtest module."""
+        args = [binary, "--accept-license", "--accept-gdpr", "--format=json"]
+        server_id = self._current_config["server_id"]
+        if server_id is not None:
+            args.append(f"--server-id={server_id}")
+        self.logger.info("Running native speedtest: %s", binary)
+
+        try:
+            completed = subprocess.run(
+                args,
+                capture_output=True,
+                text=True,
+                timeout=_NATIVE_TEST_TIMEOUT,
+                check=True,
+            )
+            report = json.loads(completed.stdout)
+            server = report.get("server", {})
+            ping = report["ping"]["latency"]
+            loaded_latency = report["download"].get("latency", {})
+            # The CLI reports no percentiles, so bufferbloat uses its
+            # interquartile mean instead of the p95
+            loaded = loaded_latency.get("iqm")
+            if "host" in server and "port" in server:
+                self._probe_address = (server["host"], int(server["port"]))
+            now = datetime.now()
+            # Bandwidth is reported in bytes per second
+            return SpeedTestResult(
+                timestamp=now,
+                ping_timestamp=now,
+                ping_ms=ping,
+                ping_baseline_ms=ping,
+                ping_loaded_ms=loaded,
+                ping_loaded_min_ms=loaded_latency.get("low"),
+                bufferbloat_ms=None if loaded is None else loaded - ping,
+                download_speed_mbps=report["download"]["bandwidth"] * 8 / 1_000_000,
+                upload_speed_mbps=report["upload"]["bandwidth"] * 8 / 1_000_000,
+                server_name=server.get("location", "Unknown"),
+                server_sponsor=server.get("name", "Unknown"),
+                is_download_complete=True,
+                is_upload_complete=True,
+                is_ping_complete=True,
+                test_mode=SpeedTestMode.FULL,
+            )
+        except (
+            OSError,
+            subprocess.SubprocessError,
+            ValueError,
+            KeyError,
+            TypeError,
+        ) as e:
+            self.logger.warning(
+                "Native speedtest failed, using the speedtest module: %s", str(e)
+            )
+            return None
+
+    def _get_speedtest_client(self) -> speedtest.Speedtest:
+        """Get the cached speedtest client, choosing a new server once it is stale."""
+        now = time.monotonic()
+        st = self._speedtest_instance
+        server_id = self._current_config["server_id"]
+        if (
+            st is None
+            or now - self._best_server_at > _BEST_SERVER_TTL
+            or server_id != self._client_server_id
+        ):
+            # Fetching the server list and pinging candidates is the slow setup
             self.logger.debug("Creating speedtest instance")
             st = speedtest.Speedtest()
+            if server_id is not None:
+                # Listing only the pinned server makes selection ping just that one
+                self.logger.info("Using pinned server %d", server_id)
+                st.get_servers([server_id])
+            else:
+                self.logger.info("Finding best server...")
+            st.get_best_server()
+            self._speedtest_instance = st
+            self._best_server_at = now
+            self._client_server_id = server_id
+        else:
+            # Only re-measure latency to the server already chosen
+            st.get_best_server([st.best])
+        return st
+
+    def _measure(
+        self,
+        st: speedtest.Speedtest,
+        on_progress: Optional[Callable[[SpeedTestResult], Any]] = None,
+        parallel_directions: bool = False,
+    ) -> SpeedTestResult:
+        """Measure ping, download and upload, reporting a copy after each phase."""
+        # Initialize result with server info
+        now = datetime.now()
+        result = SpeedTestResult(
+            timestamp=now,
+            ping_timestamp=now,
+            is_download_complete=False,
+            is_upload_complete=False,
+            is_ping_complete=False,
+            test_mode=SpeedTestMode.FULL,
+        )
 
-            # Initialize result with server info
-            result = SpeedTestResult(
-                timestamp=datetime.now(),
-                is_download_complete=False,
-                is_upload_complete=False,
-                is_ping_complete=False,
+        server_name = st.results.server.get("name", "Unknown")
+        server_sponsor = st.results.server.get("sponsor", "Unknown")
+        result.server_name = server_name
+        result.server_sponsor = server_sponsor
+
+        self.logger.info("Testing against server: %s (%s)", server_sponsor, server_name)
+
+        # Get ping first (usually fastest)
+        self.logger.info("Testing ping...")
+        ping = st.results.ping
+        result.ping_ms = ping
+        result.is_ping_complete = True
+        self.logger.debug("Ping test completed: %.2f ms", ping)
+        if on_progress is not None:
+            on_progress(result.model_copy())
+
+        address = _server_address(st.best["host"])
+        self._probe_address = address
+        idle_samples = [_tcp_connect_ms(address) for _ in range(_BASELINE_PROBES)]
+        idle = [latency for latency in idle_samples if latency is not None]
+
+        upload_client = None
+        if parallel_directions:
+            # upload() on the download's client would share its results object,
+            # so the concurrent direction gets a client of its own
+            upload_client = speedtest.Speedtest()
+            upload_client.get_best_server([st.best])
+
+        with _sample_latency(address) as loaded:
+            upload_pool = None
+            upload_future = None
+            if upload_client is not None:
+                self.logger.info("Testing upload speed alongside download...")
+                upload_pool = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="speedtest-upload"
+                )
+                upload_future = upload_pool.submit(upload_client.upload)
+
+            try:
+                # Test download speed
+                self.logger.info("Testing download speed...")
+                download_speed = st.download() / 1_000_000  # Convert to Mbps
+                result.download_speed_mbps = download_speed
+                result.is_download_complete = True
+                self.logger.debug("Download test completed: %.2f Mbps", download_speed)
+                if on_progress is not None:
+                    on_progress(result.model_copy())
+
+                # Test upload speed
+                if upload_future is not None:
+                    upload_bits = upload_future.result()
+                else:
+                    self.logger.info("Testing upload speed...")
+                    upload_bits = st.upload()
+                upload_speed = upload_bits / 1_000_000  # Convert to Mbps
+                result.upload_speed_mbps = upload_speed
+                result.is_upload_complete = True
+                self.logger.debug("Upload test completed: %.2f Mbps", upload_speed)
+            finally:
+                if upload_pool is not None:
+                    # A failed download must not leave the upload running past
+                    # the test and into the next one
+                    upload_pool.shutdown(wait=True, cancel_futures=True)
+
+        if idle and loaded:
+            result.ping_baseline_ms = sum(idle) / len(idle)
+            result.ping_loaded_ms = sum(loaded) / len(loaded)
+            result.ping_loaded_min_ms = min(loaded)
+            # The tail is the queueing delay users notice; the mean smooths it out
+            result.ping_loaded_p95_ms = (
+                statistics.quantiles(loaded, n=20)[-1] if len(loaded) > 1 else loaded[0]
             )
+            result.bufferbloat_ms = result.ping_loaded_p95_ms - result.ping_baseline_ms
+            self.logger.debug(
+                "Loaded latency: min=%.2f, mean=%.2f, p95=%.2f ms over %d samples",
+                result.ping_loaded_min_ms,
+                result.ping_loaded_ms,
+                result.ping_loaded_p95_ms,
+                len(loaded),
+            )
+        if on_progress is not None:
+            on_progress(result.model_copy())
 
-            # Get the best server based on ping
-            self.logger.info("Finding best server...")
-            st.get_best_server()
-
-            server_name = st.results.server.get("name", "Unknown")
-            server_sponsor = st.results.server.get("sponsor", "Unknown")
-            result.server_name = server_name
-            result.server_sponsor = server_sponsor
+        self.logger.debug("Speedtest blocking operations completed successfully")
+        return result
 
-            self.logger.info(
-                f"Testing against server: {server_sponsor} ({server_name})"
+    async def perform_light_check(self) -> SpeedTestResponse:
+        """Measure latency only, keeping the throughput of the last full test."""
+        try:
+            self.logger.info("Starting light connectivity check...")
+            # Queued behind any running full test, which would skew the latency
+            latencies = await asyncio.get_running_loop().run_in_executor(
+                self._executor, self._probe_latency_blocking
+            )
+            ping = min(latencies)
+            self.logger.debug(
+                "Light check latency: min=%.2f ms, avg=%.2f ms",
+                ping,
+                sum(latencies) / len(latencies),
             )
 
-            # Get ping first (usually fastest)
-            self.logger.info("Testing ping...")
-            ping = st.results.ping
-            result.ping_ms = ping
-            result.is_ping_complete = True
-            self.logger.debug("Ping test completed: %.2f ms", ping)
-
-            # Test download speed
-            self.logger.info("Testing download speed...")
-            download_speed = st.download() / 1_000_000  # Convert to Mbps
-            result.download_speed_mbps = download_speed
-            result.is_download_complete = True
-            self.logger.debug("Download test completed: %.2f Mbps", download_speed)
-
-            # Test upload speed
-            self.logger.info("Testing upload speed...")
-            upload_speed = st.upload() / 1_000_000  # Convert to Mbps
-            result.upload_speed_mbps = upload_speed
-            result.is_upload_complete = True
-            self.logger.debug("Upload test completed: %.2f Mbps", upload_speed)
-
-            self.logger.debug("Speedtest blocking operations completed successfully")
-            return result
+            # timestamp stays that of the throughput figures being kept
+            update = {
+                "ping_timestamp": datetime.now(),
+                "ping_ms": ping,
+                "is_ping_complete": True,
+                "test_mode": SpeedTestMode.LIGHT,
+            }
+            if self._last_result is None:
+                result = SpeedTestResult(**update)
+            else:
+                result = self._last_result.model_copy(update=update)
+
+            self._last_result = result
+            return SpeedTestResponse(
+                success=True,
+                result=result,
+                message="Light check completed successfully",
+            )
 
         except Exception as e:
-            self.logger.error("Error in blocking speedtest operations: %s", str(e))
-            raise
+            self.logger.error("Error performing light check: %s", str(e))
+            return SpeedTestResponse(
+                success=False, message=f"Error performing light check: {str(e)}"
+            )
+
+    def _ping_drifted(self, ping_ms: float) -> bool:
+        """Record a light check ping, telling whether it left the recent range."""
+        recent = self._recent_pings
+        drifted = False
+        if len(recent) >= _DRIFT_MIN_SAMPLES:
+            mean = statistics.fmean(recent)
+            spread = max(_DRIFT_STDEVS * statistics.pstdev(recent, mean), _DRIFT_MIN_MS)
+            drifted = abs(ping_ms - mean) > spread
+        recent.append(ping_ms)
+        return drifted
+
+    def _probe_latency_blocking(self) -> List[float]:
+        """Time TCP connects to the last full test's server, in milliseconds."""
+        address = self._probe_address
+        if address is None:
+            raise RuntimeError("No speed test server to probe; run a full test first")
+        samples = [_tcp_connect_ms(address) for _ in range(_LIGHT_CHECK_PROBES)]
+        latencies = [latency for latency in samples if latency is not None]
+        if not latencies:
+            raise ConnectionError(f"Could not connect to {address[0]}:{address[1]}")
+        return latencies
 
     async def start_continuous_testing(
         self, request: SpeedTestRequest
     ) -> SpeedTestConfigResponse:
         """Start continuous speed testing with specified interval."""
+        interval_seconds = request.interval_seconds or _DEFAULT_INTERVAL_SECONDS
         self.logger.info(
             "Starting continuous speed testing with interval: %d seconds",
-            request.interval_seconds,
+            interval_seconds,
         )
 
         try:
@@ -127,10 +526,13 @@ class SpeedTestService(BaseService):
                     success=False, message="Speed testing is already running"
                 )
 
+            if request.server_id is not None:
+                self._current_config["server_id"] = request.server_id
+
             # Update configuration
             self.logger.debug("Updating configuration for continuous testing")
             self._current_config.update(
-                {"interval_seconds": request.interval_seconds, "is_running": True}
+                {"interval_seconds": interval_seconds, "is_running": True}
             )
 
             # Start the continuous testing task
@@ -138,17 +540,17 @@ class SpeedTestService(BaseService):
             self._test_task = asyncio.create_task(self._continuous_test_loop())
 
             self.logger.info(
-                f"Started continuous speed testing with {request.interval_seconds}s interval"
+                "Started continuous speed testing with %ds interval", interval_seconds
             )
 
             return SpeedTestConfigResponse(
                 success=True,
-                message=f"Started continuous speed testing with {request.interval_seconds}s interval",
+                message=f"Started continuous speed testing every {interval_seconds}s",
                 config=self._current_config.copy(),
             )
 
         except Exception as e:
-            self.logger.error(f"Error starting continuous testing: {str(e)}")
+            self.logger.error("Error starting continuous testing: %s", str(e))
             return SpeedTestConfigResponse(
                 success=False, message=f"Error starting continuous testing: {str(e)}"
             )
@@ -188,11 +590,27 @@ class SpeedTestService(BaseService):
             )
 
         except Exception as e:
-            self.logger.error(f"Error stopping continuous testing: {str(e)}")
+            self.logger.error("Error stopping continuous testing: %s", str(e))
             return SpeedTestConfigResponse(
                 success=False, message=f"Error stopping continuous testing: {str(e)}"
             )
 
+    async def select_server(self, server_id: Optional[int]) -> SpeedTestConfigResponse:
+        """Pin the server tests run against, or None to pick the best one again."""
+        self.logger.info("Selecting speedtest server: %s", server_id)
+        # The client is rebuilt for the new server on the next test
+        self._current_config["server_id"] = server_id
+
+        return SpeedTestConfigResponse(
+            success=True,
+            message=(
+                f"Pinned speedtest server {server_id}"
+                if server_id is not None
+                else "Speedtest server will be selected automatically"
+            ),
+            config=self._current_config.copy(),
+        )
+
     async def get_current_config(self) -> SpeedTestConfigResponse:
         """Get current speed test configuration."""
         self.logger.debug("Retrieving current speed test configuration")
@@ -230,21 +648,46 @@ class SpeedTestService(BaseService):
         """Internal method to run continuous speed tests."""
         self.logger.info("Starting continuous testing loop")
         test_count = 0
+        interval = self._current_config["interval_seconds"]
+        # Tests start on fixed ticks from here, so their duration causes no drift
+        started = time.monotonic()
+        tick = 0
+        light_checks_left = 0
 
         try:
             while self._current_config["is_running"]:
                 test_count += 1
                 self.logger.debug("Starting continuous test #%d", test_count)
 
-                # Perform a speed test (already uses asyncio.to_thread internally)
-                await self.perform_speed_test()
-
-                # Wait for the specified interval
-                self.logger.debug(
-                    "Waiting %d seconds before next test",
-                    self._current_config["interval_seconds"],
-                )
-                await asyncio.sleep(self._current_config["interval_seconds"])
+                # Full tests move hundreds of MB, so most cycles only probe latency
+                # (both already run in the worker thread). Until a full test has
+                # found a server there is nothing for a light check to probe.
+                if light_checks_left == 0 or self._probe_address is None:
+                    await self.perform_speed_test()
+                    self._recent_pings.clear()
+                    light_checks_left = _FULL_TEST_EVERY - 1
+                else:
+                    light_checks_left -= 1
+                    response = await self.perform_light_check()
+                    if response.success and self._ping_drifted(response.result.ping_ms):
+                        self.logger.info(
+                            "Latency drifted to %.2f ms, running a full test next",
+                            response.result.ping_ms,
+                        )
+                        light_checks_left = 0
+
+                tick += 1
+                now = time.monotonic()
+                if now > started + tick * interval:
+                    # Resume on the next tick still ahead instead of catching up
+                    missed = int((now - started) // interval) + 1 - tick
+                    self.logger.warning(
+                        "Speed test overran its interval, skipping %d ticks", missed
+                    )
+                    tick += missed
+                delay = started + tick * interval - now
+                self.logger.debug("Waiting %.1f seconds before next test", delay)
+                await asyncio.sleep(delay)
 
         except asyncio.CancelledError:
             self.logger.info(
@@ -253,22 +696,24 @@ class SpeedTestService(BaseService):
             raise
         except Exception as e:
             self.logger.error(
-                f"Error in continuous testing loop after %d tests: {str(e)}", test_count
+                "Error in continuous testing loop after %d tests: %s",
+                test_count,
+                str(e),
             )
             self._current_config["is_running"] = False
 
+    def close(self) -> None:
+        """Release the speedtest worker thread without waiting for a running test."""
+        self._executor.shutdown(wait=False)
+
     def format_speed(self, speed_mbps: float) -> tuple[str, str]:
         """Format speed value to appropriate unit and return (value, unit)."""
-        if speed_mbps >= 1000:
-            return f"{speed_mbps / 1000:.1f}", "GB/s"
-        elif speed_mbps >= 1:
-            return f"{speed_mbps:.1f}", "MB/s"
-        else:
-            return f"{speed_mbps * 1000:.0f}", "KB/s"
+        # The same last result is formatted on every poll, so memoize per value
+        return _format_speed(speed_mbps)
 
     def format_ping(self, ping_ms: float) -> str:
         """Format ping value."""
-        return f"{ping_ms:.0f} ms"
+        return _format_ping(ping_ms)
 
 
 __all__ = ["SpeedTestService"]
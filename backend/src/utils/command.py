@@ -12,7 +12,7 @@ from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Callable, Dict, List, Literal, Optional, Union
+from typing import AsyncIterator, Callable, Dict, List, Literal, Optional, Union
 
 try:
     from ..schemas.v1.system import CommandResponse, CommandResult
@@ -90,6 +90,10 @@ class CommandExecutionResult:
 
 logger = get_logger(__name__)
 
+# Longest stdout line stream_lines accepts; asyncio's default is 64 KiB, which
+# long JSON log lines exceed
+_STREAM_LINE_LIMIT = 16 * 1024 * 1024
+
 
 class AsyncCommand:
     """
@@ -276,6 +280,111 @@ class AsyncCommand:
 
             return result
 
+    async def stream_lines(self) -> AsyncIterator[str]:
+        """
+        Execute the command and yield its stdout line by line as it is produced.
+
+        Stdout is never accumulated, so the final result stored on ``self.result``
+        has an empty ``stdout``. Stderr is drained concurrently and kept on the
+        result. Timeouts and GUI mode are not supported here.
+
+        Yields:
+            str: Each stdout line without its trailing newline
+
+        Raises:
+            RuntimeError: If command is not in pending state
+        """
+        self.logger.info(
+            "Streaming command output (async)",
+            extra={"data": {"command": " ".join(self.args)}},
+        )
+
+        if self._state != CommandState.PENDING:
+            raise RuntimeError(f"Command is not in pending state: {self._state}")
+
+        self._state = CommandState.RUNNING
+        self._start_time = datetime.now()
+        start_time = self._start_time
+
+        if self.on_start:
+            self.on_start(self)
+
+        env = os.environ.copy()
+        if self.env:
+            env.update(self.env)
+
+        stderr = ""
+        try:
+            self._process = await asyncio.create_subprocess_exec(
+                *self.args,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                cwd=str(self.cwd) if self.cwd else None,
+                env=env,
+                limit=_STREAM_LINE_LIMIT,
+            )
+        except (OSError, ValueError, subprocess.SubprocessError) as e:
+            returncode = -1
+            stderr = f"CLI command failed to start: {str(e)}"
+        else:
+            # Drain stderr in the background so a chatty stderr cannot block stdout
+            stderr_task = asyncio.create_task(self._process.stderr.read())
+            try:
+                async for raw_line in self._process.stdout:
+                    yield raw_line.decode("utf8", errors="replace").rstrip("\r\n")
+                returncode = await self._process.wait()
+                stderr_bytes = await stderr_task
+                stderr = stderr_bytes.decode("utf8", errors="replace")
+            finally:
+                if self._process.returncode is None:
+                    # The consumer stopped early or reading failed
+                    self._process.kill()
+                    await self._process.wait()
+                    self._record_stream_result(
+                        self._process.returncode, "", CommandState.KILLED, start_time
+                    )
+                if not stderr_task.done():
+                    stderr_task.cancel()
+
+        success = returncode == 0
+        state = CommandState.COMPLETED if success else CommandState.FAILED
+        result = self._record_stream_result(returncode, stderr, state, start_time)
+
+        if not success and self.on_error:
+            self.on_error(
+                self, RuntimeError(f"Command failed with return code {returncode}")
+            )
+        elif self.on_complete:
+            self.on_complete(self, result)
+
+    def _record_stream_result(
+        self,
+        returncode: int,
+        stderr: str,
+        state: CommandState,
+        start_time: datetime,
+    ) -> CommandExecutionResult:
+        """Store the final state and result of a streamed command."""
+        end_time = datetime.now()
+        result = CommandExecutionResult(
+            command=self,
+            success=returncode == 0 and state == CommandState.COMPLETED,
+            return_code=returncode,
+            stdout="",
+            stderr=stderr,
+            execution_time=(end_time - start_time).total_seconds(),
+            state=state,
+            killed=state == CommandState.KILLED,
+            start_time=start_time,
+            end_time=end_time,
+            pid=self._process.pid if self._process else None,
+            command_type=self.command_type,
+        )
+
+        self._state = state
+        self._result = result
+        return result
+
     async def _execute_cli_strategy(
         self, timeout: Optional[float] = None
     ) -> CommandExecutionResult:
@@ -0,0 +1,177 @@
+"""
+Tests for DockerService container info caching.
+"""
+
+import asyncio
+import time
+from unittest.mock import patch
+
+from backend.src.schemas.v1.docker import ContainerInfoResponse, ContainerListResponse
+from backend.src.services.v1.docker_service import DockerService
+from backend.tests.services.v1.docker.base import BaseDockerServiceTest
+
+
+class TestDockerServiceCache(BaseDockerServiceTest):
+    """Test the DockerService container info cache."""
+
+    @staticmethod
+    def _empty_listing() -> ContainerListResponse:
+        return ContainerListResponse(
+            success=True,
+            containers=[],
+            total_count=0,
+            running_count=0,
+            stopped_count=0,
+            compose_projects=[],
+            unique_images=[],
+        )
+
+    def setUp(self):
+        """Set up test fixtures."""
+        super().setUp()
+        self.service = DockerService()
+
+    def _cache_info(self, container_name: str, container_id: str):
+        info = ContainerInfoResponse(
+            success=True, container_name=container_name, container_id=container_id
+        )
+        self.service._info_cache[container_name] = (time.monotonic(), info)
+        return info
+
+    def test_cached_info_is_served(self):
+        """Test that a cached entry is returned without inspecting again."""
+        info = self._cache_info("web", "abc123")
+
+        result = self.run_async(self.service.get_container_info("web"))
+
+        self.assertIs(result, info)
+
+    def test_expired_info_is_not_served(self):
+        """Test that an entry older than the TTL is not returned."""
+        info = ContainerInfoResponse(
+            success=True, container_name="web", container_id="abc123"
+        )
+        self.service._info_cache["web"] = (time.monotonic() - 60, info)
+
+        cached = self.service._get_fresh(self.service._info_cache, "web", 5.0)
+
+        self.assertIsNone(cached)
+
+    def test_expired_info_is_served_while_watching_events(self):
+        """Test that the TTL is ignored while the events stream invalidates."""
+        info = ContainerInfoResponse(
+            success=True, container_name="web", container_id="abc123"
+        )
+        self.service._info_cache["web"] = (time.monotonic() - 60, info)
+
+        async def get_while_watching():
+            self.service._event_watcher = asyncio.ensure_future(asyncio.sleep(10))
+            try:
+                return self.service._get_fresh(
+                    self.service._info_cache, "web", self.service._info_cache_ttl
+                )
+            finally:
+                self.service._event_watcher.cancel()
+
+        cached = self.run_async(get_while_watching())
+
+        self.assertIs(cached, info)
+
+    def test_concurrent_misses_share_one_inspect_and_drop_the_lock(self):
+        """Test that misses for one container inspect once and leave no lock."""
+        info = ContainerInfoResponse(
+            success=True, container_name="web", container_id="abc123"
+        )
+        inspected = []
+
+        async def inspect(container_name):
+            inspected.append(container_name)
+            await asyncio.sleep(0)
+            return info
+
+        async def get_twice():
+            return await asyncio.gather(
+                self.service.get_container_info("web"),
+                self.service.get_container_info("web"),
+            )
+
+        with patch.object(self.service, "_inspect_container_info", inspect):
+            results = self.run_async(get_twice())
+
+        self.assertEqual(results, [info, info])
+        self.assertEqual(inspected, ["web"])
+        self.assertEqual(self.service._cache_locks, {})
+
+    def test_cached_list_is_served(self):
+        """Test that a cached container listing is returned without docker ps."""
+        listing = self._empty_listing()
+        self.service._list_cache[False] = (time.monotonic(), listing)
+
+        result = self.run_async(self.service.list_containers(all_containers=False))
+
+        self.assertIs(result, listing)
+
+    def test_expired_list_is_not_served_while_watching_events(self):
+        """Test that listings expire even while the events stream is watched."""
+        listing = self._empty_listing()
+        self.service._list_cache[False] = (time.monotonic() - 60, listing)
+
+        async def get_while_watching():
+            self.service._event_watcher = asyncio.ensure_future(asyncio.sleep(10))
+            try:
+                return self.service._get_fresh(self.service._list_cache, False, 2.0)
+            finally:
+                self.service._event_watcher.cancel()
+
+        cached = self.run_async(get_while_watching())
+
+        self.assertIsNone(cached)
+
+    def test_batch_info_serves_cached_entries_in_order(self):
+        """Test that cached entries are returned in request order without docker."""
+        web = self._cache_info("web", "abc123")
+        db = self._cache_info("db", "def456")
+
+        result = self.run_async(self.service.batch_container_info(["db", "web", "db"]))
+
+        self.assertEqual(result, [db, web, db])
+
+    def test_invalidate_by_name(self):
+        """Test invalidation by container name."""
+        self._cache_info("web", "abc123")
+        self._cache_info("db", "def456")
+
+        self.service._invalidate_container("web")
+
+        self.assertNotIn("web", self.service._info_cache)
+        self.assertIn("db", self.service._info_cache)
+
+    def test_invalidate_drops_list_cache(self):
+        """Test that invalidating any container drops the cached listing."""
+        listing = self._empty_listing()
+        self.service._list_cache[True] = (time.monotonic(), listing)
+
+        self.service._invalidate_container("web")
+
+        self.assertEqual(self.service._list_cache, {})
+
+    def test_invalidate_by_id(self):
+        """Test invalidation by container ID for entries cached under another key."""
+        self._cache_info("web", "abc123")
+
+        self.service._invalidate_container(None, "abc123")
+
+        self.assertNotIn("web", self.service._info_cache)
+
+    def test_stop_event_watcher_clears_cache(self):
+        """Test that stopping the events watcher drops cached entries."""
+        self._cache_info("web", "abc123")
+
+        async def start_and_stop():
+            self.service.start_event_watcher()
+            await self.service.stop_event_watcher()
+
+        self.run_async(start_and_stop())
+
+        self.assertFalse(self.service.is_watching_events)
+        self.assertEqual(self.service._info_cache, {})
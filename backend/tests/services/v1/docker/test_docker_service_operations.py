@@ -2,7 +2,10 @@
 Tests for DockerService container operations.
 """
 
+import asyncio
 import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
 
 from backend.src.schemas.v1.docker import ContainerStatus, HealthStatus, RedeployRequest
 from backend.src.services.v1.docker_service import DockerService
@@ -68,6 +71,19 @@ class TestDockerServiceOperations(BaseDockerServiceTest):
         if result.success:
             self.assertIsInstance(result.containers, list)
 
+    def test_list_containers_detailed(self):
+        """Test detailed listing of all containers."""
+        result = self.run_async(self.service.list_containers_detailed())
+
+        # The result depends on whether Docker is available
+        self.assertIsNotNone(result)
+        self.assertIsInstance(result.success, bool)
+        if result.success:
+            self.assertEqual(result.total_count, len(result.containers))
+            for container in result.containers:
+                self.assertTrue(container.success)
+                self.assertTrue(container.container_name)
+
     def test_parse_status(self):
         """Test container status parsing."""
         self.logger.info("Testing Docker container status parsing")
@@ -109,3 +125,86 @@ class TestDockerServiceOperations(BaseDockerServiceTest):
             self.service._parse_health_status("unknown"), HealthStatus.NONE
         )
         self.assertEqual(self.service._parse_health_status(None), HealthStatus.NONE)
+
+    def test_stream_batch_operations_yields_while_docker_runs(self):
+        """Test that batch results stream out and the slot frees without the consumer."""
+
+        async def consume():
+            finish = asyncio.Event()
+
+            class FakeCommand:
+                def __init__(self, args):
+                    self.result = SimpleNamespace(stderr="")
+
+                async def stream_lines(self):
+                    yield "web"
+                    await finish.wait()
+                    yield "db"
+
+            self.service._command_slots = asyncio.Semaphore(1)
+            with patch(
+                "backend.src.services.v1.docker_service.AsyncCommand", FakeCommand
+            ):
+                stream = self.service.stream_batch_container_operations(
+                    ["web", "db"], "stop"
+                )
+                first = await stream.__anext__()
+                # docker is still running, so only the first container is reported
+                self.assertTrue(self.service._command_slots.locked())
+
+                finish.set()
+                await asyncio.sleep(0)
+                await asyncio.sleep(0)
+                # The output is drained even though nothing consumed it yet
+                self.assertFalse(self.service._command_slots.locked())
+                rest = [response async for response in stream]
+            return first, rest
+
+        first, rest = self.run_async(consume())
+
+        self.assertEqual(first.container_name, "web")
+        self.assertTrue(first.success)
+        self.assertEqual([r.container_name for r in rest], ["db"])
+
+    def test_get_container_logs_waits_for_a_command_slot(self):
+        """Test that log reads are bounded by the docker process slots."""
+
+        class FakeCommand:
+            def __init__(self, args):
+                self.result = SimpleNamespace(success=True, stderr="")
+
+            async def stream_lines(self):
+                yield "log line"
+
+        async def read_logs_while_slots_busy():
+            self.service._command_slots = asyncio.Semaphore(1)
+            await self.service._command_slots.acquire()
+            with patch(
+                "backend.src.services.v1.docker_service.AsyncCommand", FakeCommand
+            ):
+                logs = asyncio.ensure_future(self.service.get_container_logs("web"))
+                await asyncio.sleep(0)
+                self.assertFalse(logs.done())
+
+                self.service._command_slots.release()
+                return await logs
+
+        result = self.run_async(read_logs_while_slots_busy())
+
+        self.assertTrue(result.success)
+        self.assertEqual(result.logs, ["log line"])
+
+    def test_list_containers_detailed_malformed_inspect_output(self):
+        """Test that unparseable docker inspect output becomes a failed response."""
+        run_command = AsyncMock(
+            side_effect=[
+                SimpleNamespace(success=True, stdout="abc123\n", stderr=""),
+                SimpleNamespace(success=True, stdout="not json", stderr=""),
+            ]
+        )
+
+        with patch.object(self.service, "_run_command", run_command):
+            result = self.run_async(self.service.list_containers_detailed())
+
+        self.assertFalse(result.success)
+        self.assertIn("JSON decode error", result.error)
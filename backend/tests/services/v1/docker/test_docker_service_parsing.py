@@ -3,9 +3,14 @@ Tests for DockerService parsing methods.
 """
 
 import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
 
 from backend.src.schemas.v1.docker import ContainerStatus, HealthStatus, RedeployRequest
-from backend.src.services.v1.docker_service import DockerService
+from backend.src.services.v1.docker_service import (
+    DockerService,
+    _read_max_concurrent_commands,
+)
 from backend.tests.services.v1.docker.base import BaseDockerServiceTest
 
 
@@ -148,6 +153,27 @@ class TestDockerServiceParsing(BaseDockerServiceTest):
         self.assertIn("-u nginx", command)
         self.assertIn("--restart unless-stopped", command)
 
+    def test_build_deploy_command_from_inspect_quotes_and_orders_args(self):
+        """Test that values are shell-quoted and the image comes last."""
+        container_data = {
+            "Name": "/test_container",
+            "Config": {"Image": "nginx:latest", "Env": ["GREETING=hello world"]},
+            "Mounts": [
+                {
+                    "Type": "bind",
+                    "Source": "/host",
+                    "Destination": "/data",
+                    "RW": False,
+                }
+            ],
+        }
+
+        command = self.service._build_deploy_command_from_inspect(container_data)
+
+        self.assertIn("-e 'GREETING=hello world'", command)
+        self.assertIn("-v /host:/data:ro", command)
+        self.assertTrue(command.endswith(" nginx:latest"))
+
     def test_build_redeploy_command(self):
         """Test redeploy command building."""
         request = RedeployRequest(
@@ -166,3 +192,100 @@ class TestDockerServiceParsing(BaseDockerServiceTest):
         self.assertIn("-e ENV_VAR=value", command)
         self.assertIn("-p 8080:80", command)
         self.assertIn("-v /host:/container", command)
+
+    def test_build_redeploy_args(self):
+        """Test redeploy argv building keeps every value as a single argument."""
+        request = RedeployRequest(
+            container_name="test_container",
+            environment_vars={"GREETING": "hello world"},
+            volumes=["/host path:/container"],
+        )
+
+        args = self.service._build_redeploy_args(request, "nginx:latest")
+
+        self.assertEqual(args[:3], ["docker", "run", "-d"])
+        self.assertEqual(args[-1], "nginx:latest")
+        self.assertIn("GREETING=hello world", args)
+        self.assertIn("/host path:/container", args)
+
+    def test_max_concurrency_from_environment(self):
+        """Test reading the docker process bound from the environment."""
+        with patch.dict("os.environ", {"DOCKER_MAX_CONCURRENCY": "4"}):
+            self.assertEqual(_read_max_concurrent_commands(), 4)
+        with patch.dict("os.environ", {"DOCKER_MAX_CONCURRENCY": "0"}):
+            self.assertEqual(_read_max_concurrent_commands(), 1)
+
+    def test_invalid_max_concurrency_falls_back(self):
+        """Test that a malformed DOCKER_MAX_CONCURRENCY uses the default."""
+        with patch.dict("os.environ", {"DOCKER_MAX_CONCURRENCY": "sixteen"}):
+            with self.assertLogs(DockerService.logger, level="WARNING") as logs:
+                self.assertEqual(_read_max_concurrent_commands(), 16)
+
+        self.assertIn("sixteen", logs.output[0])
+
+    def test_inspect_containers_requests_sizes(self):
+        """Test that the batched inspect asks docker for SizeRw."""
+        output = json.dumps([{"Id": "abc123def456789", "SizeRw": 2048}])
+        run_command = AsyncMock(
+            return_value=SimpleNamespace(stdout=output, stderr="", success=True)
+        )
+
+        with patch.object(self.service, "_run_command", run_command):
+            inspected = self.run_async(
+                self.service._inspect_containers(["abc123def456"])
+            )
+
+        self.assertIn("--size", run_command.await_args.args[0])
+        self.assertEqual(inspected["abc123def456"]["SizeRw"], 2048)
+
+    def test_extract_container_details(self):
+        """Test extracting container details from batched docker inspect data."""
+        container_data = {
+            "Id": "abc123def456789",
+            "Config": {"Image": "nginx:latest"},
+            "State": {"Health": {"Status": "healthy"}},
+            "SizeRw": 2048,
+            "Mounts": [{"Source": "/host", "Destination": "/data"}],
+            "NetworkSettings": {"Networks": {"bridge": {}}},
+        }
+
+        details = self.service._extract_container_details("web", container_data)
+
+        self.assertEqual(details["name"], "web")
+        self.assertEqual(details["image_tag"], "nginx:latest")
+        self.assertEqual(details["health_status"], "healthy")
+        self.assertEqual(details["size_bytes"], 2048)
+        self.assertEqual(details["mounts"], ["/host:/data"])
+        self.assertEqual(details["networks"], ["bridge"])
+
+    def test_extract_container_details_without_inspect_data(self):
+        """Test that a container missing from the inspect output keeps its name."""
+        details = self.service._extract_container_details("web", None)
+
+        self.assertEqual(details, {"name": "web"})
+
+    def test_parse_ps_entries(self):
+        """Test that docker ps rows are validated and non-container rows dropped."""
+        row = {
+            "ID": "abc123def456",
+            "Image": "nginx:latest",
+            "Command": '"nginx -g"',
+            "CreatedAt": "2024-01-01 00:00:00 +0000 UTC",
+            "State": "running",
+            "Status": "Up 2 hours",
+            "Ports": "",
+            "Names": "web",
+            "Labels": "",
+            "LocalVolumes": "0",
+            "Mounts": "",
+            "Networks": "bridge",
+            "Platform": {"architecture": "amd64", "os": "linux"},
+            "RunningFor": "2 hours ago",
+            "Size": "0B",
+        }
+
+        entries = self.service._parse_ps_entries(
+            [json.dumps(row), json.dumps({**row, "ID": ""})]
+        )
+
+        self.assertEqual([entry.ID for entry in entries], ["abc123def456"])
@@ -2,6 +2,7 @@
 Tests for SettingsService CRUD operations.
 """
 
+import asyncio
 from unittest.mock import patch
 
 from backend.src.schemas.v1.settings import (
@@ -78,6 +79,61 @@ class TestSettingsServiceCRUD(BaseDatabaseServiceTest):
         result = self.run_async(self.service.get_setting("nonexistent_setting"))
         self.assertIsNone(result)
 
+    def test_get_setting_is_served_from_cache(self):
+        """Test that a repeated read does not see writes made behind the service."""
+        self.create_test_setting("test_setting", "category", "type", "value")
+        self.run_async(self.service.get_setting("test_setting"))
+
+        self.update_test_setting("test_setting", "changed_elsewhere")
+        result = self.run_async(self.service.get_setting("test_setting"))
+
+        self.assertEqual(result.value, "value")
+
+    def test_concurrent_get_setting_shares_one_query(self):
+        """Test that simultaneous lookups of one ID hit the database once."""
+        self.create_test_setting("test_setting", "category", "type", "value")
+
+        async def get_concurrently():
+            return await asyncio.gather(
+                *(self.service.get_setting("test_setting") for _ in range(3))
+            )
+
+        with patch.object(
+            self.service.db, "get", wraps=self.service.db.get
+        ) as mock_get:
+            results = self.run_async(get_concurrently())
+
+        self.assertEqual(mock_get.call_count, 1)
+        self.assertEqual([r.value for r in results], ["value"] * 3)
+
+    def test_update_setting_invalidates_cache(self):
+        """Test that writes through the service are visible to the next read."""
+        self.create_test_setting("test_setting", "category", "type", "old_value")
+        self.run_async(self.service.get_all_settings())
+
+        request = SettingUpdateRequest(id="test_setting", value="new_value")
+        self.run_async(self.service.update_setting(request))
+        result = self.run_async(self.service.get_all_settings())
+
+        self.assertEqual(result.settings[0].value, "new_value")
+        self.assertEqual(
+            self.run_async(self.service.get_setting("test_setting")).value,
+            "new_value",
+        )
+
+    def test_update_cached_setting_skips_refetch(self):
+        """Test that updating a cached setting answers without reading it back."""
+        self.create_test_setting("test_setting", "category", "type", "old_value")
+        self.run_async(self.service.get_setting("test_setting"))
+
+        request = SettingUpdateRequest(id="test_setting", value="new_value")
+        with patch.object(self.service.db, "get", wraps=self.service.db.get) as get:
+            result = self.run_async(self.service.update_setting(request))
+
+        get.assert_not_called()
+        self.assertEqual(result.setting.value, "new_value")
+        self.assertEqual(result.setting.category, "category")
+
     def test_update_setting_success(self):
         """Test successful setting update."""
         # Create test setting
@@ -97,6 +153,21 @@ class TestSettingsServiceCRUD(BaseDatabaseServiceTest):
         updated_setting = self.get_test_setting("test_setting")
         self.assertEqual(updated_setting["value"], "new_value")
 
+    def test_update_setting_without_returning_setting(self):
+        """Test that opting out of the returned setting skips the read-back."""
+        self.create_test_setting("test_setting", "category", "type", "old_value")
+
+        request = SettingUpdateRequest(id="test_setting", value="new_value")
+        with patch.object(self.service.db, "get", wraps=self.service.db.get) as get:
+            result = self.run_async(
+                self.service.update_setting(request, return_setting=False)
+            )
+
+        get.assert_not_called()
+        self.assertTrue(result.success)
+        self.assertIsNone(result.setting)
+        self.assertEqual(self.get_test_setting("test_setting")["value"], "new_value")
+
     def test_update_setting_not_found(self):
         """Test updating a setting that doesn't exist."""
         request = SettingUpdateRequest(id="nonexistent_setting", value="new_value")
@@ -186,6 +257,23 @@ class TestSettingsServiceCRUD(BaseDatabaseServiceTest):
         self.assertEqual(setting1["value"], "new_value1")
         self.assertEqual(setting2["value"], "new_value2")
 
+    def test_bulk_update_settings_repeated_id_last_wins(self):
+        """Test that the last update of a repeated setting ID is the one stored."""
+        self.create_test_setting("setting1", "category", "type", "old_value")
+
+        request = BulkSettingsUpdateRequest(
+            settings=[
+                SettingUpdateRequest(id="setting1", value="first_value"),
+                SettingUpdateRequest(id="setting1", value="last_value"),
+            ]
+        )
+
+        result = self.run_async(self.service.bulk_update_settings(request))
+
+        self.assertTrue(result.success)
+        self.assertEqual(len(result.updated_settings), 2)
+        self.assertEqual(self.get_test_setting("setting1")["value"], "last_value")
+
     def test_bulk_update_settings_partial_failure(self):
         """Test bulk update with some failures."""
         # Create only one test setting
@@ -2,6 +2,10 @@
 Tests for SpeedTestService basic functionality.
 """
 
+import contextlib
+import statistics
+from unittest.mock import MagicMock, patch
+
 from backend.src.schemas.v1.speedtest import SpeedTestRequest, SpeedTestResult
 from backend.src.services.v1.speedtest_service import SpeedTestService
 
@@ -56,7 +60,7 @@ class TestSpeedTestServiceBasic(BaseSpeedTestServiceTest):
 
     def test_perform_speed_test_with_request(self):
         """Test speed test with custom request."""
-        request = SpeedTestRequest(interval_seconds=5)
+        request = SpeedTestRequest(interval_seconds=30)
         result = self.run_async(self.service.perform_speed_test(request))
 
         # The result depends on internet connectivity
@@ -82,6 +86,43 @@ class TestSpeedTestServiceBasic(BaseSpeedTestServiceTest):
         # We'll test the public perform_speed_test method instead
         pass
 
+    def test_measure_reports_loaded_latency_spread(self):
+        """Test that loaded latency keeps min, mean and p95, with bufferbloat on p95."""
+        client = MagicMock()
+        client.results.server = {"name": "Test", "sponsor": "Example"}
+        client.results.ping = 10.0
+        client.best = {"host": "speedtest.example.com:8080"}
+        client.download.return_value = 100_000_000
+        client.upload.return_value = 10_000_000
+        loaded = [float(ms) for ms in range(1, 101)]
+
+        @contextlib.contextmanager
+        def sample_latency(address):
+            yield loaded
+
+        module = "backend.src.services.v1.speedtest_service"
+        with patch(f"{module}._tcp_connect_ms", return_value=10.0):
+            with patch(f"{module}._sample_latency", sample_latency):
+                result = self.service._measure(client)
+
+        p95 = statistics.quantiles(loaded, n=20)[-1]
+        self.assertEqual(result.ping_loaded_min_ms, 1.0)
+        self.assertEqual(result.ping_loaded_ms, 50.5)
+        self.assertEqual(result.ping_loaded_p95_ms, p95)
+        self.assertEqual(result.bufferbloat_ms, p95 - 10.0)
+
+    def test_select_server_pins_config(self):
+        """Test pinning a server and clearing the pin again."""
+        result = self.run_async(self.service.select_server(1234))
+
+        self.assertTrue(result.success)
+        self.assertEqual(result.config["server_id"], 1234)
+
+        result = self.run_async(self.service.select_server(None))
+
+        self.assertTrue(result.success)
+        self.assertIsNone(result.config["server_id"])
+
     def test_format_speed(self):
         """Test speed formatting."""
         # Test different speed ranges
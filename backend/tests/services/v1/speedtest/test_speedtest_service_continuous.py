@@ -3,9 +3,18 @@ Tests for SpeedTestService continuous testing functionality.
 """
 
 import asyncio
-from unittest.mock import patch
-
-from backend.src.schemas.v1.speedtest import SpeedTestRequest
+import time
+from datetime import datetime
+from unittest.mock import AsyncMock, patch
+
+from pydantic import ValidationError
+
+from backend.src.schemas.v1.speedtest import (
+    SpeedTestMode,
+    SpeedTestRequest,
+    SpeedTestResponse,
+    SpeedTestResult,
+)
 from backend.src.services.v1.speedtest_service import SpeedTestService
 from backend.tests.services.v1.speedtest.base import BaseSpeedTestServiceTest
 
@@ -20,23 +29,103 @@ class TestSpeedTestServiceContinuous(BaseSpeedTestServiceTest):
 
     def test_start_continuous_testing_success(self):
         """Test starting continuous testing successfully."""
-        request = SpeedTestRequest(interval_seconds=5)
+        request = SpeedTestRequest(interval_seconds=60)
         result = self.run_async(self.service.start_continuous_testing(request))
 
         self.assertTrue(result.success)
         self.assertIn("Started continuous speed testing", result.message)
         self.assertIsNotNone(result.config)
-        self.assertEqual(result.config["interval_seconds"], 5)
+        self.assertEqual(result.config["interval_seconds"], 60)
         self.assertTrue(result.config["is_running"])
 
         # Verify the task was created
         self.assertIsNotNone(self.service._test_task)
         self.assertFalse(self.service._test_task.done())
 
+    def test_short_interval_is_rejected(self):
+        """Test that intervals shorter than a single test fail validation."""
+        with self.assertRaises(ValidationError):
+            SpeedTestRequest(interval_seconds=5)
+
+    def test_concurrent_speed_tests_share_one_run(self):
+        """Test that callers arriving during a test await it instead of starting one."""
+        calls = []
+
+        def run_blocking(on_progress=None, parallel_directions=False):
+            calls.append(on_progress)
+            time.sleep(0.05)
+            return SpeedTestResult(
+                download_speed_mbps=1.0, upload_speed_mbps=1.0, ping_ms=1.0
+            )
+
+        async def run_concurrently():
+            return await asyncio.gather(
+                self.service.perform_speed_test(), self.service.perform_speed_test()
+            )
+
+        with patch.object(self.service, "_run_speedtest_blocking", run_blocking):
+            first, second = self.run_async(run_concurrently())
+
+        self.assertEqual(len(calls), 1)
+        self.assertTrue(first.success)
+        self.assertIs(first.result, second.result)
+
+    def test_stream_speed_test_yields_each_phase(self):
+        """Test that a stream yields the snapshots reported by the worker thread."""
+        ping_done = SpeedTestResult(ping_ms=10.0, is_ping_complete=True)
+        all_done = SpeedTestResult(
+            ping_ms=10.0, download_speed_mbps=100.0, upload_speed_mbps=20.0
+        )
+
+        def run_blocking(on_progress=None, parallel_directions=False):
+            on_progress(ping_done)
+            on_progress(all_done)
+            return all_done
+
+        async def collect():
+            return [snapshot async for snapshot in self.service.stream_speed_test()]
+
+        with patch.object(self.service, "_run_speedtest_blocking", run_blocking):
+            snapshots = self.run_async(collect())
+
+        self.assertEqual(snapshots, [ping_done, all_done])
+        self.assertIs(self.service._last_result, all_done)
+
+    def test_light_check_keeps_last_throughput(self):
+        """Test that a light check refreshes ping but keeps measured throughput."""
+        measured_at = datetime(2024, 1, 1, 12, 0, 0)
+        self.service._last_result = SpeedTestResult(
+            download_speed_mbps=100.0,
+            upload_speed_mbps=20.0,
+            ping_ms=50.0,
+            timestamp=measured_at,
+            ping_timestamp=measured_at,
+        )
+
+        with patch.object(
+            self.service, "_probe_latency_blocking", return_value=[30.0, 12.0, 25.0]
+        ):
+            response = self.run_async(self.service.perform_light_check())
+
+        self.assertTrue(response.success)
+        self.assertEqual(response.result.ping_ms, 12.0)
+        self.assertEqual(response.result.download_speed_mbps, 100.0)
+        self.assertEqual(response.result.upload_speed_mbps, 20.0)
+        self.assertEqual(response.result.test_mode, SpeedTestMode.LIGHT)
+        self.assertEqual(response.result.timestamp, measured_at)
+        self.assertGreater(response.result.ping_timestamp, measured_at)
+
+    def test_light_check_without_full_test_fails(self):
+        """Test that a light check has no server to probe before a full test."""
+        response = self.run_async(self.service.perform_light_check())
+
+        self.assertFalse(response.success)
+        self.assertIn("full test", response.message)
+
     def test_start_continuous_testing_already_running(self):
         """Test starting continuous testing when already running."""
         # Start testing first
-        request = SpeedTestRequest(interval_seconds=5)
+        request = SpeedTestRequest(interval_seconds=30)
         self.run_async(self.service.start_continuous_testing(request))
 
         # Try to start again
@@ -48,7 +137,7 @@ class TestSpeedTestServiceContinuous(BaseSpeedTestServiceTest):
     def test_stop_continuous_testing_success(self):
         """Test stopping continuous testing successfully."""
         # Start testing first
-        request = SpeedTestRequest(interval_seconds=5)
+        request = SpeedTestRequest(interval_seconds=30)
         self.run_async(self.service.start_continuous_testing(request))
 
         # Stop testing
@@ -100,8 +189,7 @@ class TestSpeedTestServiceContinuous(BaseSpeedTestServiceTest):
     def test_continuous_test_loop_cancellation(self):
         """Test continuous test loop cancellation."""
         # Start continuous testing
-        # Very short interval for testing
-        request = SpeedTestRequest(interval_seconds=0.1)
+        request = SpeedTestRequest(interval_seconds=30)
         self.run_async(self.service.start_continuous_testing(request))
 
         # Let it run briefly
@@ -121,7 +209,7 @@ class TestSpeedTestServiceContinuous(BaseSpeedTestServiceTest):
         with patch.object(
             self.service, "perform_speed_test", side_effect=Exception("Test error")
         ):
-            request = SpeedTestRequest(interval_seconds=0.1)
+            request = SpeedTestRequest(interval_seconds=30)
             self.run_async(self.service.start_continuous_testing(request))
 
             # Let it run briefly to trigger the exception
@@ -130,11 +218,90 @@ class TestSpeedTestServiceContinuous(BaseSpeedTestServiceTest):
             # Verify it stopped due to exception
             self.assertFalse(self.service._current_config["is_running"])
 
+    def test_continuous_test_loop_skips_overrun_ticks(self):
+        """Test that a test overrunning its interval waits for the next future tick."""
+        delays = []
+
+        async def record_sleep(delay):
+            delays.append(delay)
+            self.service._current_config["is_running"] = False
+
+        self.service._current_config.update(
+            {"interval_seconds": 30, "is_running": True}
+        )
+        clock = patch("backend.src.services.v1.speedtest_service.time")
+        with patch.object(self.service, "perform_speed_test", AsyncMock()):
+            with patch("asyncio.sleep", record_sleep), clock as mock_time:
+                # The loop starts at 0 and the first test finishes at 75
+                mock_time.monotonic.side_effect = [0.0, 75.0]
+                self.run_async(self.service._continuous_test_loop())
+
+        self.assertEqual(delays, [15.0])
+
+    def test_continuous_test_loop_retries_full_test_without_server(self):
+        """Test that cycles stay full tests until one has found a server to probe."""
+        sleeps = []
+
+        async def record_sleep(delay):
+            sleeps.append(delay)
+            if len(sleeps) == 2:
+                self.service._current_config["is_running"] = False
+
+        self.service._current_config.update(
+            {"interval_seconds": 30, "is_running": True}
+        )
+        full_test = AsyncMock()
+        light_check = AsyncMock()
+        with patch.object(self.service, "perform_speed_test", full_test):
+            with patch.object(self.service, "perform_light_check", light_check):
+                with patch("asyncio.sleep", record_sleep):
+                    self.run_async(self.service._continuous_test_loop())
+
+        self.assertEqual(full_test.await_count, 2)
+        light_check.assert_not_awaited()
+
+    def test_continuous_test_loop_escalates_on_latency_drift(self):
+        """Test that a light check ping far off the recent ones runs a full test."""
+        pings = iter([20.0, 21.0, 20.0, 21.0, 20.0, 80.0])
+        sleeps = []
+
+        async def light_check():
+            result = SpeedTestResult(ping_ms=next(pings))
+            return SpeedTestResponse(success=True, result=result)
+
+        async def record_sleep(delay):
+            sleeps.append(delay)
+            if len(sleeps) == 8:
+                self.service._current_config["is_running"] = False
+
+        self.service._probe_address = ("speedtest.example.com", 8080)
+        self.service._current_config.update(
+            {"interval_seconds": 30, "is_running": True}
+        )
+        full_test = AsyncMock()
+        with patch.object(self.service, "perform_speed_test", full_test):
+            with patch.object(self.service, "perform_light_check", light_check):
+                with patch("asyncio.sleep", record_sleep):
+                    self.run_async(self.service._continuous_test_loop())
+
+        # The first cycle, then the one right after the drifting ping
+        self.assertEqual(full_test.await_count, 2)
+        self.assertEqual(len(self.service._recent_pings), 0)
+
+    def test_steady_pings_do_not_drift(self):
+        """Test that jitter within the recent range keeps light checks going."""
+        drifted = [
+            self.service._ping_drifted(ping)
+            for ping in [20.0, 21.0, 20.0, 21.0, 20.0, 23.0, 19.0]
+        ]
+
+        self.assertEqual(drifted, [False] * 7)
+
     def test_start_continuous_testing_exception(self):
         """Test exception handling in start_continuous_testing."""
         # Mock asyncio.create_task to raise an exception
         with patch("asyncio.create_task", side_effect=Exception("Task creation error")):
-            request = SpeedTestRequest(interval_seconds=5)
+            request = SpeedTestRequest(interval_seconds=30)
             result = self.run_async(self.service.start_continuous_testing(request))
 
             self.assertFalse(result.success)
@@ -143,7 +310,7 @@ class TestSpeedTestServiceContinuous(BaseSpeedTestServiceTest):
     def test_stop_continuous_testing_exception(self):
         """Test exception handling in stop_continuous_testing."""
         # Start testing first
-        request = SpeedTestRequest(interval_seconds=5)
+        request = SpeedTestRequest(interval_seconds=30)
         self.run_async(self.service.start_continuous_testing(request))
 
         # Mock task.cancel to raise an exception
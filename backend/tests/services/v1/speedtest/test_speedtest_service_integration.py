@@ -29,7 +29,7 @@ class TestSpeedTestServiceIntegration(BaseSpeedTestServiceTest):
         self.assertEqual(last_result.result, result1.result)
 
         # 3. Start continuous testing
-        request = SpeedTestRequest(interval_seconds=0.1)
+        request = SpeedTestRequest(interval_seconds=30)
         start_result = self.run_async(self.service.start_continuous_testing(request))
         self.assertTrue(start_result.success)
 
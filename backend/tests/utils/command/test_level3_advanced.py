@@ -11,6 +11,7 @@ These tests assume Level 1 and Level 2 tests pass.
 """
 
 import asyncio
+import sys
 import tempfile
 from pathlib import Path
 from unittest.mock import MagicMock, patch
@@ -314,5 +315,61 @@ class TestLevel3Advanced(BaseCommandTest):
             self.assertFalse(result.timeout_occurred)
             self.assertEqual(result.command_type, CommandType.CLI)
 
+    def test_41_stream_lines(self) -> None:
+        """Test streaming stdout line by line."""
+        cmd = AsyncCommand.cmd("echo first&& echo second")
+
+        async def collect():
+            return [line async for line in cmd.stream_lines()]
+
+        lines = self.run_async(collect())
+
+        self.assertEqual(["first", "second"], lines)
+        self.assertEqual(CommandState.COMPLETED, cmd.state)
+        self.assertTrue(cmd.result.success)
+        self.assertEqual("", cmd.result.stdout)
+
+    def test_42_stream_lines_failure(self) -> None:
+        """Test streaming a command that cannot start."""
+        cmd = AsyncCommand(["nonexistent_command_12345"])
+
+        async def collect():
+            return [line async for line in cmd.stream_lines()]
+
+        lines = self.run_async(collect())
+
+        self.assertEqual([], lines)
+        self.assert_command_failure(cmd.result)
+
+    def test_43_stream_lines_long_line(self) -> None:
+        """Test streaming a line longer than asyncio's default 64 KiB limit."""
+        cmd = AsyncCommand([sys.executable, "-c", "print('x' * 200_000)"])
+
+        async def collect():
+            return [line async for line in cmd.stream_lines()]
+
+        lines = self.run_async(collect())
+
+        self.assertEqual(["x" * 200_000], lines)
+        self.assertTrue(cmd.result.success)
+
+    def test_44_stream_lines_closed_early(self) -> None:
+        """Test that abandoning a stream leaves the command killed, not running."""
+        script = "import time\nprint('first', flush=True)\ntime.sleep(30)"
+        cmd = AsyncCommand([sys.executable, "-c", script])
+
+        async def take_first():
+            stream = cmd.stream_lines()
+            first = await stream.__anext__()
+            await stream.aclose()
+            return first
+
+        first = self.run_async(take_first())
+
+        self.assertEqual("first", first)
+        self.assertEqual(CommandState.KILLED, cmd.state)
+        self.assertTrue(cmd.result.killed)
+        self.assertFalse(cmd.result.success)
+
 
 __all__ = ["TestLevel3Advanced"]